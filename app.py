@@ -1,11 +1,20 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import time
+import asyncio
 import os
 import json
+import hashlib
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
-from urllib.parse import urlparse
+from io import BytesIO
+from urllib.parse import urlsplit
 import sys
+from collections import Counter, OrderedDict
+from itertools import islice
 
 # Import logging configuration
 from src.logging_config import setup_logging, get_logger
@@ -23,16 +32,26 @@ except Exception:
 
 # Import your existing scanner modules
 try:
+    from src.analyzer import init_analysis_worker
     from src.crawler import WebCrawler
-    from src.analyzer import PageAnalyzer
-    from src.issues import IssueDetector
-    from src.enhanced_pandas_reporter import EnhancedPandasReporter
+    from src.issues import IssueDetector, ISSUE_COLUMNS
+    from src.styles import CUSTOM_CSS
+    from src.utils import normalize_url
     app_logger.info("All modules imported successfully")
 except ImportError as e:
     app_logger.error(f"Failed to import required modules: {e}")
     st.error("Application initialization failed. Please check your installation.")
     sys.exit(1)
 
+# Bump whenever scan output changes so stale cached scans are ignored
+SCANNER_VERSION = "1.5.0"
+
+# Persistent cache of completed scans, keyed by URL + settings + version
+SCAN_CACHE_DIR = os.path.join("reports", "cache")
+SCAN_CACHE_TTL = 24 * 60 * 60  # Re-scan sites after a day
+SAVED_SCANS_DIR = os.path.join(SCAN_CACHE_DIR, "saved")
+MAX_SAVED_SCANS = 20  # Full scans kept in memory per session; older ones are spilled to disk
+
 # Page config
 st.set_page_config(
     page_title="SEO Scanner Pro",
@@ -41,176 +60,164 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for professional look
-st.markdown("""
-<style>
-    /* Hide Streamlit branding */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    .stDeployButton {display: none;}
-    
-    /* Global styling */
-    .stApp {
-        background: #f8fafc;
-    }
-    
-    .main .block-container {
-        padding-top: 2rem;
-        max-width: 1200px;
-    }
-    
-    /* Hero section */
-    .hero {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 3rem 2rem;
-        text-align: center;
-        color: white;
-        margin-bottom: 2rem;
-        border-radius: 16px;
-        box-shadow: 0 8px 32px rgba(0,0,0,0.1);
-    }
-    
-    .hero h1 {
-        font-size: 2.5rem;
-        font-weight: 700;
-        margin: 0 0 1rem 0;
-        font-family: 'Inter', -apple-system, sans-serif;
-    }
-    
-    .hero p {
-        font-size: 1.2rem;
-        opacity: 0.95;
-        margin: 0;
-        font-family: 'Inter', -apple-system, sans-serif;
-    }
-    
-    /* Cards and sections */
-    .metric-card {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 12px;
-        box-shadow: 0 4px 20px rgba(0,0,0,0.08);
-        border: 1px solid #e2e8f0;
-        text-align: center;
-        margin-bottom: 1rem;
-    }
-    
-    .metric-card h3 {
-        margin: 0 0 0.5rem 0;
-        font-size: 2rem;
-        font-weight: 700;
-        color: #1a202c;
-    }
-    
-    .metric-card p {
-        margin: 0;
-        color: #64748b;
-        font-weight: 500;
-    }
-    
-    .critical { color: #dc2626; }
-    .warning { color: #ea580c; }
-    .good { color: #059669; }
-    
-    /* Issue cards */
-    .issue-card {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 12px;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.06);
-        border-left: 4px solid #dc2626;
-        margin-bottom: 1rem;
-    }
-    
-    .issue-card.warning {
-        border-left-color: #ea580c;
-    }
-    
-    .issue-card h4 {
-        margin: 0 0 0.5rem 0;
-        color: #1a202c;
-        font-size: 1.1rem;
-    }
-    
-    .issue-card .url {
-        color: #64748b;
-        font-size: 0.9rem;
-        margin-bottom: 0.5rem;
-    }
-    
-    .issue-card .recommendation {
-        color: #059669;
-        font-weight: 500;
-        margin-top: 0.5rem;
-    }
-    
-    /* Sidebar styling */
-    .sidebar .sidebar-content {
-        background: white;
-        border-radius: 12px;
-        padding: 1.5rem;
-        margin-bottom: 1rem;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.06);
-    }
-    
-    /* Button styling */
-    .stButton > button {
-        width: 100%;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        border: none;
-        border-radius: 8px;
-        padding: 0.75rem 1.5rem;
-        font-weight: 600;
-        transition: all 0.3s ease;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 8px 25px rgba(102, 126, 234, 0.4);
-    }
-    
-    /* Progress bar styling */
-    .stProgress .st-bo {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    }
-    
-    /* Input styling */
-    .stTextInput > div > div > input {
-        border: 2px solid #e2e8f0;
-        border-radius: 8px;
-        padding: 0.75rem;
-        font-size: 1rem;
-    }
-    
-    .stTextInput > div > div > input:focus {
-        border-color: #667eea;
-        box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-    }
-</style>
-""", unsafe_allow_html=True)
+# Streamlit clears the page on every rerun, so the styles must be re-sent each time
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+# Dashboard card markup, filled in by display_results
+METRIC_TEMPLATE = '<div class="metric-card"><h3 class="{color_class}">{value}</h3><p>{label}</p></div>'
+ISSUE_TEMPLATE = (
+    '<div class="issue-card {card_class}">'
+    '<h4>{icon} {category}: {issue}</h4>'
+    '<div class="url">{url}</div>'
+    '<div class="recommendation">💡 {recommendation}</div>'
+    '</div>'
+)
 
 # Initialize session state
 if 'scan_results' not in st.session_state:
     st.session_state.scan_results = None
 if 'scanned_websites' not in st.session_state:
     st.session_state.scanned_websites = set()
+    st.session_state.scanned_count = 0  # len(scanned_websites), kept alongside for the sidebar
 if 'scan_history' not in st.session_state:
     st.session_state.scan_history = []
+    st.session_state.scan_history_version = 0  # Bumped on every append to scan_history
+    st.session_state.recent_scans = (0, [])  # (scan_history_version, newest-first recent scans)
 if 'saved_scans' not in st.session_state:
-    st.session_state.saved_scans = {}  # Store full scan data by ID
+    st.session_state.saved_scans = OrderedDict()  # Store full scan data by ID, least recently used first
 
 def check_user_limits(url):
     """All features available - no limitations"""
     return True, "✅ All features unlocked - unlimited scans available!"
 
+def _saved_scan_path(scan_id):
+    """Get the file a saved scan is spilled to"""
+    digest = hashlib.sha256(scan_id.encode('utf-8')).hexdigest()
+    return os.path.join(SAVED_SCANS_DIR, f"{digest}.pkl")
+
+def _spill_to_disk(scan_id, results):
+    """Write a scan evicted from memory to disk so it can still be reopened"""
+    try:
+        os.makedirs(SAVED_SCANS_DIR, exist_ok=True)
+        with open(_saved_scan_path(scan_id), 'wb') as f:
+            pickle.dump(results, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        app_logger.error(f"Failed to spill scan {scan_id} to disk: {e}")
+
+def _load_from_disk(scan_id):
+    """Load a spilled scan, or None if it is not on disk"""
+    try:
+        with open(_saved_scan_path(scan_id), 'rb') as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        app_logger.warning(f"Ignoring unreadable saved scan {scan_id}: {e}")
+        return None
+
+def save_scan(results):
+    """Keep a scan in the session's saved scans, spilling the least recently used ones past the cap"""
+    saved_scans = st.session_state.saved_scans
+    scan_id = results['id']
+    
+    if scan_id in saved_scans:
+        saved_scans.move_to_end(scan_id)
+    else:
+        while len(saved_scans) >= MAX_SAVED_SCANS:
+            oldest_id, oldest = saved_scans.popitem(last=False)
+            _spill_to_disk(oldest_id, oldest)
+    saved_scans[scan_id] = results
+
 def load_previous_scan(scan_id):
-    """Load a previous scan by ID"""
-    if scan_id in st.session_state.saved_scans:
-        st.session_state.scan_results = st.session_state.saved_scans[scan_id]
-        return True
-    return False
+    """Load a previous scan by ID from memory, falling back to disk"""
+    results = st.session_state.saved_scans.get(scan_id)
+    if results is None:
+        results = _load_from_disk(scan_id)
+        if results is None:
+            return False
+    
+    save_scan(results)
+    st.session_state.scan_results = results
+    return True
+
+@st.cache_resource
+def get_issue_detector():
+    """Shared IssueDetector - it keeps no per-scan state"""
+    return IssueDetector()
+
+@st.cache_resource
+def get_analysis_pool():
+    """Process pool for page analysis, shared across scans so worker processes stay warm"""
+    return ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=init_analysis_worker)
+
+def record_scan(results, netloc):
+    """Add a completed scan to the session's saved scans and history"""
+    domain = netloc.replace('www.', '')
+    if domain not in st.session_state.scanned_websites:
+        st.session_state.scanned_websites.add(domain)
+        st.session_state.scanned_count += 1
+    
+    # Save full scan data
+    save_scan(results)
+    
+    # Add to history list for sidebar display
+    st.session_state.scan_history.append({
+        'id': results['id'],
+        'url': results['url'],
+        'domain': domain,
+        'date': results['scan_date'],
+        'pages': results['pages_found'],
+        'issues': len(results['issues']['url'])
+    })
+    st.session_state.scan_history_version += 1
+
+def get_recent_scans():
+    """Last 10 scans newest first, rebuilt only when the scan history has changed"""
+    version, recent = st.session_state.recent_scans
+    if version != st.session_state.scan_history_version:
+        version = st.session_state.scan_history_version
+        recent = list(reversed(st.session_state.scan_history[-10:]))
+        st.session_state.recent_scans = (version, recent)
+    return recent
+
+def _scan_cache_path(url, max_pages):
+    """Get the cache file for a scan of url limited to max_pages"""
+    parsed = urlsplit(url.strip())
+    normalized_url = f"{parsed.scheme.lower()}://{parsed.netloc.lower()}{parsed.path.rstrip('/')}"
+    if parsed.query:
+        normalized_url += f"?{parsed.query}"
+    
+    cache_key = f"{normalized_url}|{max_pages}|{SCANNER_VERSION}"
+    digest = hashlib.sha256(cache_key.encode('utf-8')).hexdigest()
+    return os.path.join(SCAN_CACHE_DIR, f"{digest}.pkl")
+
+def cached_scan(url, max_pages=10):
+    """Return a recent cached scan of url if there is one, otherwise run and cache a new scan"""
+    cache_path = _scan_cache_path(url, max_pages)
+    
+    try:
+        if time.time() - os.path.getmtime(cache_path) < SCAN_CACHE_TTL:
+            with open(cache_path, 'rb') as f:
+                results = pickle.load(f)
+            app_logger.info(f"Loaded cached scan for {url} from {cache_path}")
+            record_scan(results, urlsplit(url).netloc)
+            return results, None
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        app_logger.warning(f"Ignoring unreadable scan cache {cache_path}: {e}")
+    
+    results, error = run_seo_scan(url, max_pages)
+    
+    if results:
+        try:
+            os.makedirs(SCAN_CACHE_DIR, exist_ok=True)
+            with open(cache_path, 'wb') as f:
+                pickle.dump(results, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            app_logger.error(f"Failed to cache scan results: {e}")
+    
+    return results, error
 
 def run_seo_scan(url, max_pages=10):
     """Run the SEO scan using existing code"""
@@ -218,16 +225,16 @@ def run_seo_scan(url, max_pages=10):
     scan_logger.info(f"Starting SEO scan for {url} with max_pages={max_pages}")
     
     try:
-        domain = urlparse(url).netloc
+        domain = urlsplit(url).netloc
         if not domain:
             scan_logger.error(f"Invalid URL format: {url}")
             return None, "Invalid URL format"
         
         # Initialize components
         try:
-            crawler = WebCrawler(url, max_pages=max_pages)
-            analyzer = PageAnalyzer(domain)
-            issue_detector = IssueDetector()
+            # HTML parsing is CPU-bound, so pages are analyzed across processes as they are fetched
+            crawler = WebCrawler(url, max_pages=max_pages, executor=get_analysis_pool())
+            issue_detector = get_issue_detector()
             scan_logger.info("Scanner components initialized successfully")
         except Exception as e:
             scan_logger.error(f"Failed to initialize scanner components: {e}")
@@ -237,15 +244,18 @@ def run_seo_scan(url, max_pages=10):
         progress_bar = st.progress(0)
         status_text = st.empty()
         
-        # Step 1: Crawl
-        status_text.text("🌐 Crawling website...")
+        # Step 1: Crawl and analyze
+        status_text.text("🌐 Crawling and analyzing website...")
         progress_bar.progress(25)
         
         try:
-            crawled_pages = crawler.crawl_site()
+            crawled_pages = asyncio.run(crawler.crawl_site_async())
             scan_logger.info(f"Crawling completed. Found {len(crawled_pages) if crawled_pages else 0} pages")
         except Exception as e:
             scan_logger.error(f"Crawling failed: {e}")
+            if isinstance(e, BrokenProcessPool):
+                # Don't keep handing out a pool whose workers have died
+                get_analysis_pool.clear()
             progress_bar.empty()
             status_text.empty()
             return None, f"Crawling failed: {str(e)}"
@@ -256,44 +266,27 @@ def run_seo_scan(url, max_pages=10):
             status_text.empty()
             return None, "No pages found to analyze. The website may be blocking crawlers or have connection issues."
         
-        # Step 2: Analyze
-        status_text.text("📊 Analyzing pages...")
-        progress_bar.progress(50)
-        pages_data = []
-        
-        try:
-            for i, (page_url, html_content) in enumerate(crawled_pages):
-                page_analysis = analyzer.analyze_page(page_url, html_content)
-                pages_data.append(page_analysis)
-                # Update progress for each page
-                current_progress = 50 + (i + 1) * 15 // len(crawled_pages)
-                progress_bar.progress(min(current_progress, 65))
-            scan_logger.info(f"Page analysis completed for {len(pages_data)} pages")
-        except Exception as e:
-            scan_logger.error(f"Page analysis failed: {e}")
-            progress_bar.empty()
-            status_text.empty()
-            return None, f"Analysis failed: {str(e)}"
+        pages_data = [analysis for _, analysis in crawled_pages]
         
-        # Step 3: Detect issues
+        # Step 2: Detect issues
         status_text.text("🔍 Detecting SEO issues...")
         progress_bar.progress(75)
         
         try:
             all_issues = issue_detector.detect_all_issues(pages_data)
-            scan_logger.info(f"Issue detection completed. Found {len(all_issues)} issues")
+            scan_logger.info(f"Issue detection completed. Found {len(all_issues['url'])} issues")
         except Exception as e:
             scan_logger.error(f"Issue detection failed: {e}")
             progress_bar.empty()
             status_text.empty()
             return None, f"Issue detection failed: {str(e)}"
         
-        # Step 4: Generate report
+        # Step 3: Generate report
         status_text.text("📈 Generating reports...")
         progress_bar.progress(100)
         
         # Store results
-        scan_id = f"{urlparse(url).netloc}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        scan_id = f"{domain}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         results = {
             'id': scan_id,
             'url': url,
@@ -305,13 +298,15 @@ def run_seo_scan(url, max_pages=10):
         
         # Save to backend storage
         try:
+            # Imported here so the landing page doesn't pay for the reporting stack
+            from src.enhanced_pandas_reporter import EnhancedPandasReporter
             reporter = EnhancedPandasReporter(url)
             scan_metadata = {
                 'scan_id': scan_id,
                 'url': url,
                 'scan_date': datetime.now().isoformat(),
                 'pages_found': len(pages_data),
-                'total_issues': len(all_issues),
+                'total_issues': len(all_issues['url']),
                 'user_agent': 'SEO Scanner Pro',
                 'scan_type': 'full_site_analysis'
             }
@@ -322,21 +317,7 @@ def run_seo_scan(url, max_pages=10):
             # Continue even if backend storage fails
         
         # Add to history and save full scan data
-        domain = urlparse(url).netloc.replace('www.', '')
-        st.session_state.scanned_websites.add(domain)
-        
-        # Save full scan data
-        st.session_state.saved_scans[scan_id] = results
-        
-        # Add to history list for sidebar display
-        st.session_state.scan_history.append({
-            'id': scan_id,
-            'url': url,
-            'domain': domain,
-            'date': datetime.now(),
-            'pages': len(pages_data),
-            'issues': len(all_issues)
-        })
+        record_scan(results, domain)
         
         status_text.text("✅ Scan complete!")
         time.sleep(1)
@@ -350,6 +331,12 @@ def run_seo_scan(url, max_pages=10):
         scan_logger.error(f"Unexpected error during scan: {e}", exc_info=True)
         return None, f"Unexpected error: {str(e)}"
 
+def first_issues_of_type(issues, issue_type, limit):
+    """First `limit` issues of one type from the issue columns, as dicts for ISSUE_TEMPLATE"""
+    rows = zip(*(issues[column] for column in ISSUE_COLUMNS))
+    matching = (row for row in rows if row[0] == issue_type)  # 'type' is the first column
+    return [dict(zip(ISSUE_COLUMNS, row)) for row in islice(matching, limit)]
+
 def display_results(results):
     """Display scan results in a professional dashboard format"""
     pages_data = results['pages_data']
@@ -357,102 +344,59 @@ def display_results(results):
     
     # Calculate metrics
     total_pages = len(pages_data)
-    critical_issues = len([i for i in issues if i['type'] == 'CRITICAL'])
-    warning_issues = len([i for i in issues if i['type'] == 'WARNING'])
+    issue_counts = Counter(issues['type'])
+    critical_issues = issue_counts['CRITICAL']
+    warning_issues = issue_counts['WARNING']
     
     # Calculate average SEO score
-    scores = []
-    for page in pages_data:
-        score = calculate_seo_score(page)
-        scores.append(score)
-    avg_score = sum(scores) / len(scores) if scores else 0
+    features = extract_page_features(pages_data)
+    scores = calculate_seo_scores(**features)
+    avg_score = scores.mean() if len(scores) else 0
     
     # Metrics dashboard
     st.markdown("### 📊 SEO Analysis Dashboard")
     
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3>{total_pages}</h3>
-            <p>Pages Analyzed</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        color_class = "critical" if critical_issues > 5 else "warning" if critical_issues > 0 else "good"
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3 class="{color_class}">{critical_issues}</h3>
-            <p>Critical Issues</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        color_class = "warning" if warning_issues > 10 else "good"
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3 class="{color_class}">{warning_issues}</h3>
-            <p>Warning Issues</p>
-        </div>
-        """, unsafe_allow_html=True)
+    critical_class = "critical" if critical_issues > 5 else "warning" if critical_issues > 0 else "good"
+    warning_class = "warning" if warning_issues > 10 else "good"
+    score_class = "good" if avg_score >= 80 else "warning" if avg_score >= 60 else "critical"
     
-    with col4:
-        grade = get_grade(avg_score)
-        color_class = "good" if avg_score >= 80 else "warning" if avg_score >= 60 else "critical"
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3 class="{color_class}">{avg_score:.0f}/100</h3>
-            <p>Average SEO Score ({grade})</p>
-        </div>
-        """, unsafe_allow_html=True)
+    metric_cards = "".join([
+        METRIC_TEMPLATE.format(color_class="", value=total_pages, label="Pages Analyzed"),
+        METRIC_TEMPLATE.format(color_class=critical_class, value=critical_issues, label="Critical Issues"),
+        METRIC_TEMPLATE.format(color_class=warning_class, value=warning_issues, label="Warning Issues"),
+        METRIC_TEMPLATE.format(color_class=score_class, value=f"{avg_score:.0f}/100",
+                               label=f"Average SEO Score ({get_grade(avg_score)})"),
+    ])
+    st.markdown(f'<div class="metric-grid">{metric_cards}</div>', unsafe_allow_html=True)
     
     # Top Issues Section
-    if issues:
+    if issues['url']:
         st.markdown("### 🎯 Top Priority Issues")
         
         # Sort issues by priority
-        critical_issues_list = [i for i in issues if i['type'] == 'CRITICAL'][:5]
-        warning_issues_list = [i for i in issues if i['type'] == 'WARNING'][:3]
+        critical_issues_list = first_issues_of_type(issues, 'CRITICAL', 5)
+        warning_issues_list = first_issues_of_type(issues, 'WARNING', 3)
         
-        for issue in critical_issues_list:
-            st.markdown(f"""
-            <div class="issue-card">
-                <h4>🚨 {issue['category']}: {issue['issue']}</h4>
-                <div class="url">{issue['url']}</div>
-                <div class="recommendation">💡 {issue['recommendation']}</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        for issue in warning_issues_list:
-            st.markdown(f"""
-            <div class="issue-card warning">
-                <h4>⚠️ {issue['category']}: {issue['issue']}</h4>
-                <div class="url">{issue['url']}</div>
-                <div class="recommendation">💡 {issue['recommendation']}</div>
-            </div>
-            """, unsafe_allow_html=True)
+        issue_cards = "".join(
+            [ISSUE_TEMPLATE.format(card_class="", icon="🚨", **issue) for issue in critical_issues_list] +
+            [ISSUE_TEMPLATE.format(card_class="warning", icon="⚠️", **issue) for issue in warning_issues_list]
+        )
+        st.markdown(issue_cards, unsafe_allow_html=True)
     
     # Page Performance Table
     st.markdown("### 📄 Page Performance")
     
-    # Create DataFrame for page summary
-    page_summary = []
-    for page in pages_data:
-        score = calculate_seo_score(page)
-        page_summary.append({
-            'URL': page['url'],
-            'SEO Score': score,
-            'Grade': get_grade(score),
-            'Title Length': page.get('title_length', 0),
-            'Has Meta Desc': '✅' if page.get('has_meta_description', False) else '❌',
-            'H1 Count': page.get('h1_count', 0),
-            'Images w/o Alt': page.get('images_without_alt', 0),
-            'Word Count': page.get('word_count', 0)
-        })
-    
-    df = pd.DataFrame(page_summary)
+    # Create DataFrame for page summary, one array per column
+    df = pd.DataFrame({
+        'URL': [page.url for page in pages_data],
+        'SEO Score': scores,
+        'Grade': get_grades(scores),
+        'Title Length': features['title_length'],
+        'Has Meta Desc': np.where(features['has_meta_description'], '✅', '❌'),
+        'H1 Count': features['h1_count'],
+        'Images w/o Alt': features['images_without_alt'],
+        'Word Count': features['word_count']
+    })
     st.dataframe(df, use_container_width=True)
     
     # Download section - All features available
@@ -461,8 +405,9 @@ def display_results(results):
     col1, col2 = st.columns(2)
     with col1:
         try:
+            from src.enhanced_pandas_reporter import EnhancedPandasReporter, as_columns
             reporter = EnhancedPandasReporter(results['url'])
-            excel_buffer = reporter.create_excel_download_buffer(pd.DataFrame(pages_data), pd.DataFrame(issues))
+            excel_buffer = reporter.create_excel_download_buffer(pd.DataFrame(as_columns(pages_data)), pd.DataFrame(issues))
             
             st.download_button(
                 label="📊 Download Excel Report",
@@ -474,60 +419,55 @@ def display_results(results):
             st.error(f"Error preparing Excel report: {e}")
     
     with col2:
-        csv_data = pd.DataFrame(issues).to_csv(index=False)
+        csv_buffer = BytesIO()
+        pd.DataFrame(issues).to_csv(csv_buffer, index=False)
+        csv_buffer.seek(0)
         st.download_button(
             label="📋 Download CSV Report",
-            data=csv_data,
+            data=csv_buffer,
             file_name=f"seo_issues_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
             mime="text/csv"
         )
 
-def calculate_seo_score(page):
-    """Calculate SEO score for a page"""
-    score = 0
-    
+# Per-page fields used for scoring and the page table, with their array dtypes
+PAGE_FEATURES = {
+    'title_length': np.int64,
+    'has_meta_description': bool,
+    'meta_desc_length': np.int64,
+    'h1_count': np.int64,
+    'total_images': np.int64,
+    'images_without_alt': np.int64,
+    'word_count': np.int64,
+}
+
+def extract_page_features(pages_data):
+    """Extract each scoring field from every page as one NumPy array per field"""
+    return {
+        key: np.fromiter((getattr(page, key) for page in pages_data), dtype=dtype, count=len(pages_data))
+        for key, dtype in PAGE_FEATURES.items()
+    }
+
+def calculate_seo_scores(title_length, has_meta_description, meta_desc_length, h1_count,
+                         total_images, images_without_alt, word_count):
+    """Calculate SEO scores for all pages from their feature arrays"""
     # Title (25 points)
-    if page.get('title'):
-        title_len = page.get('title_length', 0)
-        if 30 <= title_len <= 60:
-            score += 25
-        elif title_len > 0:
-            score += 15
+    title_score = np.where((title_length >= 30) & (title_length <= 60), 25, np.where(title_length > 0, 15, 0))
     
     # Meta Description (25 points)
-    if page.get('has_meta_description'):
-        meta_len = page.get('meta_desc_length', 0)
-        if 120 <= meta_len <= 160:
-            score += 25
-        elif meta_len > 0:
-            score += 15
+    meta_len = np.where(has_meta_description, meta_desc_length, 0)
+    meta_score = np.where((meta_len >= 120) & (meta_len <= 160), 25, np.where(meta_len > 0, 15, 0))
     
     # H1 Tag (20 points)
-    h1_count = page.get('h1_count', 0)
-    if h1_count == 1:
-        score += 20
-    elif h1_count > 0:
-        score += 10
+    h1_score = np.select([h1_count == 1, h1_count > 0], [20, 10], default=0)
     
-    # Images (15 points)
-    total_images = page.get('total_images', 0)
-    if total_images > 0:
-        images_without_alt = page.get('images_without_alt', 0)
-        alt_coverage = (total_images - images_without_alt) / total_images
-        score += alt_coverage * 15
-    else:
-        score += 15  # No images = perfect score
+    # Images (15 points) - no images = perfect score
+    alt_coverage = (total_images - images_without_alt) / np.maximum(total_images, 1)
+    image_score = np.where(total_images > 0, alt_coverage * 15, 15)
     
     # Content (15 points)
-    word_count = page.get('word_count', 0)
-    if word_count >= 300:
-        score += 15
-    elif word_count >= 150:
-        score += 10
-    elif word_count > 0:
-        score += 5
+    content_score = np.select([word_count >= 300, word_count >= 150, word_count > 0], [15, 10, 5], default=0)
     
-    return min(score, 100)
+    return np.minimum(title_score + meta_score + h1_score + image_score + content_score, 100)
 
 def get_grade(score):
     """Convert score to letter grade"""
@@ -542,6 +482,10 @@ def get_grade(score):
     else:
         return 'F'
 
+def get_grades(scores):
+    """Convert an array of scores to letter grades"""
+    return np.select([scores >= 90, scores >= 80, scores >= 70, scores >= 60], ['A', 'B', 'C', 'D'], default='F')
+
 # Health check endpoint
 @st.cache_data(ttl=60)
 def health_check():
@@ -549,7 +493,7 @@ def health_check():
     try:
         # Test basic functionality
         test_url = "https://example.com"
-        parsed = urlparse(test_url)
+        parsed = urlsplit(test_url)
         
         # Basic component initialization test
         test_domain = "example.com"
@@ -557,7 +501,7 @@ def health_check():
         return {
             "status": "healthy",
             "timestamp": datetime.now().isoformat(),
-            "version": "1.0.0",
+            "version": SCANNER_VERSION,
             "components": {
                 "url_parsing": bool(parsed.netloc),
                 "logging": logger is not None,
@@ -599,9 +543,8 @@ def main():
         
         # App info
         st.markdown("**Status:** All features unlocked")
-        websites_scanned = len(st.session_state.scanned_websites)
         total_scans = len(st.session_state.scan_history)
-        st.markdown(f"**Websites Scanned:** {websites_scanned}")
+        st.markdown(f"**Websites Scanned:** {st.session_state.scanned_count}")
         st.markdown(f"**Total Scans:** {total_scans}")
         
         # Admin section
@@ -649,7 +592,7 @@ def main():
         # Scan History
         st.markdown("## 📈 Recent Scans")
         if st.session_state.scan_history:
-            for i, scan in enumerate(reversed(st.session_state.scan_history[-10:])):  # Show last 10, newest first
+            for i, scan in enumerate(get_recent_scans()):  # Show last 10, newest first
                 # Create a clickable button for each scan
                 scan_date = scan['date'].strftime('%m/%d %H:%M')
                 button_label = f"**{scan['domain']}**\n{scan_date} - {scan['pages']} pages, {scan['issues']} issues"
@@ -663,12 +606,9 @@ def main():
                     help="Click to view this scan",
                     use_container_width=True
                 ):
-                    # Load the previous scan if ID exists in saved scans
-                    if scan_id in st.session_state.saved_scans:
-                        if load_previous_scan(scan_id):
-                            st.rerun()
-                        else:
-                            st.error("Scan data not found")
+                    # Load the previous scan from memory or its spilled copy on disk
+                    if load_previous_scan(scan_id):
+                        st.rerun()
                     else:
                         st.warning("This scan was from before the update. Please run a new scan.")
         else:
@@ -692,11 +632,10 @@ def main():
             
             submitted = st.form_submit_button("🔍 Start SEO Analysis")
             
+            # Validate URL
+            url = normalize_url(url) if url else None
+            
             if submitted and url:
-                # Validate URL
-                if not url.startswith(('http://', 'https://')):
-                    url = 'https://' + url
-                
                 # Check user limits
                 can_scan, message = check_user_limits(url)
                 
@@ -705,7 +644,7 @@ def main():
                     
                     # Run scan
                     with st.spinner("Running SEO analysis..."):
-                        results, error = run_seo_scan(url, max_pages)
+                        results, error = cached_scan(url, max_pages)
                     
                     if results:
                         st.session_state.scan_results = results
@@ -5,11 +5,12 @@ Provides command-line access to all stored scans and reports
 """
 
 import os
-import json
+import orjson
 import pandas as pd
 from datetime import datetime
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 class BackendAdmin:
     def __init__(self):
@@ -21,7 +22,8 @@ class BackendAdmin:
             print("ERROR: Backend storage directory not found")
             return
         
-        scan_folders = [f for f in os.listdir(self.backend_path) if os.path.isdir(os.path.join(self.backend_path, f))]
+        with os.scandir(self.backend_path) as entries:
+            scan_folders = [entry.name for entry in entries if entry.is_dir()]
         scan_folders.sort(reverse=True)  # Most recent first
         
         print(f"\nBACKEND STORAGE REPORT")
@@ -37,20 +39,15 @@ class BackendAdmin:
         print(f"{'Domain':<20} {'Date':<12} {'Pages':<6} {'Issues':<7} {'Folder'}")
         print(f"{'-'*60}")
         
-        for folder in scan_folders:
-            folder_path = os.path.join(self.backend_path, folder)
+        # Metadata files are small and I/O-bound, so read them in parallel
+        with ThreadPoolExecutor(max_workers=min(32, len(scan_folders))) as executor:
+            futures = [executor.submit(self._load_scan_metadata, folder) for folder in scan_folders]
+        
+        for folder, future in zip(scan_folders, futures):
             try:
-                # Find metadata file
-                metadata_file = None
-                for file in os.listdir(folder_path):
-                    if file.startswith("scan_metadata_"):
-                        metadata_file = os.path.join(folder_path, file)
-                        break
+                metadata = future.result()
                 
-                if metadata_file and os.path.exists(metadata_file):
-                    with open(metadata_file, 'r', encoding='utf-8') as f:
-                        metadata = json.load(f)
-                    
+                if metadata is not None:
                     domain = metadata.get('domain', folder.split('_')[0])[:19]
                     scan_date = metadata.get('scan_date', 'Unknown')[:10]
                     pages = metadata.get('total_pages', 0)
@@ -63,6 +60,22 @@ class BackendAdmin:
             except Exception as e:
                 print(f"{folder.split('_')[0]:<20} {'Error':<12} {'?':<6} {'?':<7} {folder}")
     
+    def _load_scan_metadata(self, folder):
+        """Load a scan folder's metadata JSON, or None if it has no metadata file"""
+        folder_path = os.path.join(self.backend_path, folder)
+        
+        # Find metadata file
+        with os.scandir(folder_path) as entries:
+            metadata_file = next(
+                (entry.path for entry in entries if entry.name.startswith("scan_metadata_")), None
+            )
+        
+        if not metadata_file:
+            return None
+        
+        with open(metadata_file, 'rb') as f:
+            return orjson.loads(f.read())
+    
     def scan_details(self, scan_folder):
         """Show detailed information about a specific scan"""
         folder_path = os.path.join(self.backend_path, scan_folder)
@@ -75,30 +88,26 @@ class BackendAdmin:
         print(f"{'='*60}")
         
         # List all files in the folder
-        files = os.listdir(folder_path)
+        with os.scandir(folder_path) as entries:
+            files = sorted(entries, key=lambda entry: entry.name)
         print(f"Folder: Folder: {os.path.abspath(folder_path)}")
         print(f"File: Files: {len(files)}")
         
         # Show metadata if available
-        metadata_file = None
-        for file in files:
-            if file.startswith("scan_metadata_"):
-                metadata_file = os.path.join(folder_path, file)
-                break
+        metadata_file = next((entry.path for entry in files if entry.name.startswith("scan_metadata_")), None)
         
         if metadata_file:
-            with open(metadata_file, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
+            with open(metadata_file, 'rb') as f:
+                metadata = orjson.loads(f.read())
             
             print(f"\nMETADATA: METADATA:")
             for key, value in metadata.items():
                 print(f"  {key}: {value}")
         
         print(f"\nFILES IN SCAN FOLDER: FILES IN SCAN FOLDER:")
-        for file in sorted(files):
-            file_path = os.path.join(folder_path, file)
-            file_size = os.path.getsize(file_path)
-            print(f"  File: {file} ({file_size:,} bytes)")
+        for entry in files:
+            file_size = entry.stat().st_size
+            print(f"  File: {entry.name} ({file_size:,} bytes)")
     
     def export_scan_data(self, scan_folder, output_dir="exported_scans"):
         """Export a scan's data to a new directory"""
@@ -127,17 +136,14 @@ class BackendAdmin:
         cutoff_date = datetime.now().timestamp() - (keep_days * 24 * 60 * 60)
         removed_count = 0
         
-        scan_folders = [f for f in os.listdir(self.backend_path) if os.path.isdir(os.path.join(self.backend_path, f))]
+        with os.scandir(self.backend_path) as entries:
+            old_folders = [entry for entry in entries if entry.is_dir() and entry.stat().st_mtime < cutoff_date]
         
-        for folder in scan_folders:
-            folder_path = os.path.join(self.backend_path, folder)
-            folder_modified = os.path.getmtime(folder_path)
-            
-            if folder_modified < cutoff_date:
-                import shutil
-                shutil.rmtree(folder_path)
-                removed_count += 1
-                print(f"REMOVED:  Removed old scan: {folder}")
+        import shutil
+        for entry in old_folders:
+            shutil.rmtree(entry.path)
+            removed_count += 1
+            print(f"REMOVED:  Removed old scan: {entry.name}")
         
         print(f"SUCCESS: Cleanup complete. Removed {removed_count} old scans (older than {keep_days} days)")
 
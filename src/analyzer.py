@@ -4,23 +4,160 @@ Page Analyzer for SEO Scanner
 Analyzes individual pages for SEO elements and issues
 """
 
-from bs4 import BeautifulSoup
+import lxml.html
+import numpy as np
+from lxml import etree
 import re
+import codecs
+import hashlib
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from urllib.parse import urlparse
 
+@dataclass(slots=True)
+class PageAnalysis:
+    """SEO elements extracted from a single page"""
+    url: str
+    domain: str
+    title: str = ''
+    title_length: int = 0
+    has_meta_description: bool = False
+    meta_desc_length: int = 0
+    meta_description: str = ''
+    h1_count: int = 0
+    h1_text: str = ''
+    h2_count: int = 0
+    h3_count: int = 0
+    total_headings: int = 0
+    total_images: int = 0
+    images_without_alt: int = 0
+    total_links: int = 0
+    internal_links: int = 0
+    external_links: int = 0
+    word_count: int = 0
+    page_size: int = 0
+    has_viewport_meta: bool = False
+    lang_attribute: str = ''
+    canonical_url: str = ''
+    robots_meta: str = ''
+    schema_markup: bool = False
+
+# Tags the analysis reads, grouped in a single pass over the document
+COLLECTED_TAGS = ('html', 'title', 'meta', 'h1', 'h2', 'h3', 'img', 'a', 'link', 'script')
+
+# Tags whose text is not page content
+NON_CONTENT_TAGS = {'script', 'style', 'template'}
+
+# Pages arrive as raw bytes: let lxml follow a declared charset, then the HTTP header's,
+# otherwise assume UTF-8 (lxml's own fallback is Latin-1, which garbles undeclared UTF-8 pages)
+UTF8_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+DECLARED_CHARSET_PARSER = lxml.html.HTMLParser()
+_CHARSET_DECLARATION_RE = re.compile(rb'<meta[^>]+charset', re.IGNORECASE)
+_UTF16_BOMS = (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)
+HTML_SNIFF_BYTES = 2048
+
+# Analyses kept per analyzer for pages whose HTML repeats verbatim (404 pages, templates)
+ANALYSIS_CACHE_SIZE = 256
+
+# A maximal run of word characters is always bounded by \b, so this matches r'\b\w+\b'
+_WORD_RE = re.compile(r'\w+')
+
+# 1 for the bytes \w matches in ASCII text, 0 for the rest
+_ASCII_WORD_BYTES = np.zeros(256, dtype=np.int8)
+_ASCII_WORD_BYTES[np.frombuffer(b'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_', dtype=np.uint8)] = 1
+
+def _looks_like_html(head):
+    """Whether the start of a page could be markup - it has a tag and no NUL bytes (bar UTF-16)"""
+    if head.startswith(_UTF16_BOMS):
+        return True
+    return b'<' in head and b'\x00' not in head
+
+@lru_cache(maxsize=64)
+def _charset_parser(charset):
+    """An HTML parser decoding the charset an HTTP header names, or UTF8_PARSER if it's unknown"""
+    try:
+        return lxml.html.HTMLParser(encoding=charset)
+    except LookupError:
+        pass
+    
+    # libxml2 and Python spell some charsets differently (latin-1 vs iso8859-1)
+    try:
+        return lxml.html.HTMLParser(encoding=codecs.lookup(charset).name)
+    except LookupError:
+        return UTF8_PARSER
+
+def parse_html(html_content, charset=None):
+    """Parse page bytes (or str) into an lxml document, or None if the page is empty
+    
+    charset is the one from the response's Content-Type header, if it gave one.
+    """
+    if isinstance(html_content, str):
+        html_content = html_content.encode('utf-8')
+        parser = UTF8_PARSER
+    elif html_content.startswith(_UTF16_BOMS) or _CHARSET_DECLARATION_RE.search(html_content, 0, 1024):
+        # Browsers look for a charset declaration in the first 1024 bytes
+        parser = DECLARED_CHARSET_PARSER
+    elif charset:
+        parser = _charset_parser(charset.strip().lower())
+    else:
+        parser = UTF8_PARSER
+    
+    try:
+        return lxml.html.document_fromstring(html_content, parser=parser)
+    except etree.ParserError:
+        # Empty or whitespace-only document
+        return None
+
+@lru_cache(maxsize=4096)
+def _cached_netloc(url):
+    """netloc of a URL, memoized since navigation links repeat on every page"""
+    return urlparse(url).netloc
+
 class PageAnalyzer:
     def __init__(self, domain):
         self.domain = domain
+        self._cache = {}  # (content hash, host) -> PageAnalysis, oldest first
     
-    def analyze_page(self, url, html_content):
+    def analyze_page(self, url, html_content, charset=None):
         """Analyze a single page for SEO elements"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        return self.analyze_page_with_links(url, html_content, charset)[0]
+    
+    def analyze_page_with_links(self, url, html_content, charset=None):
+        """Analyze a page and return the hrefs of its links too, parsing it only once
+        
+        charset is the Content-Type header's, used when the page declares none itself.
+        Results are reused for byte-identical HTML on the same host.
+        """
+        content = html_content.encode('utf-8') if isinstance(html_content, str) else html_content
+        if not _looks_like_html(content[:HTML_SNIFF_BYTES]):
+            # Empty bodies, binary files and plain text have nothing to parse
+            return PageAnalysis(url=url, domain=self.domain, page_size=len(html_content)), []
+        
+        # Link classification depends on the page's host, and decoding on the
+        # header charset, so both are part of the key
+        key = (hashlib.blake2b(content, digest_size=16).digest(), _cached_netloc(url), charset)
+        
+        cached = self._cache.get(key)
+        if cached is not None:
+            analysis, hrefs = cached
+            return replace(analysis, url=url), hrefs
+        
+        result = self._analyze_page(url, html_content, charset)
+        if len(self._cache) >= ANALYSIS_CACHE_SIZE:
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = result
+        return result
+    
+    def _analyze_page(self, url, html_content, charset=None):
+        """Analyze a single page for SEO elements, returning the analysis and the page's hrefs"""
+        elements, text = self._collect_elements(html_content, charset)
+        hrefs = [a.get('href') for a in elements['a'] if a.get('href') is not None]
         
         # Basic page info
         analysis = {
             'url': url,
             'domain': self.domain,
-            'title': self._get_title(soup),
+            'title': self._get_title(elements['title']),
             'title_length': 0,
             'has_meta_description': False,
             'meta_desc_length': 0,
@@ -49,58 +186,95 @@ class PageAnalyzer:
             analysis['title_length'] = len(analysis['title'])
         
         # Meta description
-        meta_desc = self._get_meta_description(soup)
+        meta_desc = self._get_meta_description(elements['meta'])
         if meta_desc:
             analysis['has_meta_description'] = True
             analysis['meta_desc_length'] = len(meta_desc)
             analysis['meta_description'] = meta_desc
         
         # Headers analysis
-        analysis.update(self._analyze_headers(soup))
+        analysis.update(self._analyze_headers(elements['h1'], elements['h2'], elements['h3']))
         
         # Images analysis
-        analysis.update(self._analyze_images(soup))
+        analysis.update(self._analyze_images(elements['img']))
         
         # Links analysis
-        analysis.update(self._analyze_links(soup, url))
+        analysis.update(self._analyze_links(hrefs, url))
         
         # Content analysis
-        analysis['word_count'] = self._count_words(soup)
+        analysis['word_count'] = self._count_words(text)
         
         # Technical SEO elements
-        analysis.update(self._analyze_technical_seo(soup))
+        analysis.update(self._analyze_technical_seo(elements))
         
-        return analysis
+        return PageAnalysis(**analysis), hrefs
     
-    def _get_title(self, soup):
+    def _collect_elements(self, html_content, charset=None):
+        """Walk the document once, grouping the tags we analyze and gathering its visible text"""
+        elements = {tag: [] for tag in COLLECTED_TAGS}
+        text_parts = []
+        
+        root = parse_html(html_content, charset)
+        if root is None:
+            return elements, ''
+        
+        skip_depth = 0  # > 0 while inside a non-content element
+        for event, element in etree.iterwalk(root, events=('start', 'end')):
+            tag = element.tag
+            is_tag = isinstance(tag, str)
+            
+            if event == 'start':
+                if is_tag and tag in elements:
+                    elements[tag].append(element)
+                if is_tag and tag in NON_CONTENT_TAGS:
+                    skip_depth += 1
+                elif is_tag and not skip_depth and element.text:
+                    text_parts.append(element.text)
+            else:
+                if is_tag and tag in NON_CONTENT_TAGS:
+                    skip_depth -= 1
+                # Text after an element (including comments) belongs to its parent
+                if not skip_depth and element.tail:
+                    text_parts.append(element.tail)
+        
+        return elements, ''.join(text_parts)
+    
+    def _element_text(self, element):
+        """Text inside an element, leaving out script/style/template contents and comments"""
+        parts = [element.text or '']
+        for child in element:
+            if isinstance(child.tag, str) and child.tag not in NON_CONTENT_TAGS:
+                parts.append(self._element_text(child))
+            parts.append(child.tail or '')
+        return ''.join(parts)
+    
+    def _get_title(self, titles):
         """Extract page title"""
-        title_tag = soup.find('title')
-        return title_tag.get_text().strip() if title_tag else ''
+        return self._element_text(titles[0]).strip() if titles else ''
+    
+    def _find_meta(self, metas, name):
+        """First meta tag with the given name attribute, or None"""
+        return next((meta for meta in metas if meta.get('name') == name), None)
     
-    def _get_meta_description(self, soup):
+    def _get_meta_description(self, metas):
         """Extract meta description"""
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        if meta_desc and meta_desc.get('content'):
-            return meta_desc['content'].strip()
+        meta_desc = self._find_meta(metas, 'description')
+        if meta_desc is not None and meta_desc.get('content'):
+            return meta_desc.get('content').strip()
         return ''
     
-    def _analyze_headers(self, soup):
+    def _analyze_headers(self, h1_tags, h2_tags, h3_tags):
         """Analyze header tags (H1, H2, H3, etc.)"""
-        h1_tags = soup.find_all('h1')
-        h2_tags = soup.find_all('h2')
-        h3_tags = soup.find_all('h3')
-        
         return {
             'h1_count': len(h1_tags),
-            'h1_text': h1_tags[0].get_text().strip() if h1_tags else '',
+            'h1_text': self._element_text(h1_tags[0]).strip() if h1_tags else '',
             'h2_count': len(h2_tags),
             'h3_count': len(h3_tags),
             'total_headings': len(h1_tags) + len(h2_tags) + len(h3_tags)
         }
     
-    def _analyze_images(self, soup):
+    def _analyze_images(self, images):
         """Analyze images for alt text and optimization"""
-        images = soup.find_all('img')
         images_without_alt = 0
         
         for img in images:
@@ -113,30 +287,26 @@ class PageAnalyzer:
             'images_without_alt': images_without_alt
         }
     
-    def _analyze_links(self, soup, current_url):
+    def _analyze_links(self, links, current_url):
         """Analyze internal and external links"""
-        links = soup.find_all('a', href=True)
         internal_links = 0
         external_links = 0
-        current_domain = urlparse(current_url).netloc
+        current_domain = _cached_netloc(current_url)
+        # Absolute links back to this host can be recognised without parsing them
+        same_host_prefixes = (f"http://{current_domain}/", f"https://{current_domain}/")
         
-        for link in links:
-            href = link['href']
-            
+        for href in links:
             # Skip anchor links and javascript
-            if href.startswith('#') or href.startswith('javascript:'):
+            if href.startswith(('#', 'javascript:')):
                 continue
             
-            # Determine if internal or external
-            if href.startswith('http'):
-                link_domain = urlparse(href).netloc
-                if link_domain == current_domain:
-                    internal_links += 1
-                else:
-                    external_links += 1
-            else:
-                # Relative links are internal
+            # Relative links are internal
+            if not href.startswith('http'):
                 internal_links += 1
+            elif href.startswith(same_host_prefixes) or _cached_netloc(href) == current_domain:
+                internal_links += 1
+            else:
+                external_links += 1
         
         return {
             'total_links': len(links),
@@ -144,18 +314,19 @@ class PageAnalyzer:
             'external_links': external_links
         }
     
-    def _count_words(self, soup):
+    def _count_words(self, text):
         """Count words in main content"""
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
+        if not text.isascii():
+            # \w is Unicode-aware, which a byte table can't reproduce
+            return len(_WORD_RE.findall(text))
         
-        # Get text and clean it
-        text = soup.get_text()
-        words = re.findall(r'\b\w+\b', text.lower())
-        return len(words)
+        # A word starts wherever a non-word byte is followed by a word byte
+        is_word = _ASCII_WORD_BYTES[np.frombuffer(text.encode('ascii'), dtype=np.uint8)]
+        if not len(is_word):
+            return 0
+        return int(np.count_nonzero(is_word[1:] > is_word[:-1])) + int(is_word[0])
     
-    def _analyze_technical_seo(self, soup):
+    def _analyze_technical_seo(self, elements):
         """Analyze technical SEO elements"""
         result = {
             'has_viewport_meta': False,
@@ -166,26 +337,50 @@ class PageAnalyzer:
         }
         
         # Viewport meta tag
-        viewport = soup.find('meta', attrs={'name': 'viewport'})
+        viewport = self._find_meta(elements['meta'], 'viewport')
         result['has_viewport_meta'] = viewport is not None
         
         # Language attribute
-        html_tag = soup.find('html')
-        if html_tag and html_tag.get('lang'):
-            result['lang_attribute'] = html_tag['lang']
+        html_tags = elements['html']
+        if html_tags and html_tags[0].get('lang'):
+            result['lang_attribute'] = html_tags[0].get('lang')
         
-        # Canonical URL
-        canonical = soup.find('link', attrs={'rel': 'canonical'})
-        if canonical and canonical.get('href'):
-            result['canonical_url'] = canonical['href']
+        # Canonical URL (rel can hold several space-separated values)
+        canonical = next(
+            (link for link in elements['link'] if 'canonical' in (link.get('rel') or '').split()), None
+        )
+        if canonical is not None and canonical.get('href'):
+            result['canonical_url'] = canonical.get('href')
         
         # Robots meta tag
-        robots = soup.find('meta', attrs={'name': 'robots'})
-        if robots and robots.get('content'):
-            result['robots_meta'] = robots['content']
+        robots = self._find_meta(elements['meta'], 'robots')
+        if robots is not None and robots.get('content'):
+            result['robots_meta'] = robots.get('content')
         
         # Schema markup (JSON-LD)
-        schema_scripts = soup.find_all('script', type='application/ld+json')
+        schema_scripts = [script for script in elements['script'] if script.get('type') == 'application/ld+json']
         result['schema_markup'] = len(schema_scripts) > 0
         
-        return result
\ No newline at end of file
+        return result
+
+# Per-worker analyzers keyed by domain, set up by init_analysis_worker. Left as None
+# outside such workers (e.g. in threads), where each task gets a fresh analyzer.
+_worker_analyzers = None
+WORKER_ANALYZER_LIMIT = 8  # Domains whose analyzers (and content caches) a worker keeps
+
+def init_analysis_worker():
+    """ProcessPoolExecutor initializer - lets each worker keep its analyzers across tasks"""
+    global _worker_analyzers
+    _worker_analyzers = {}
+
+def analyze_page_task(domain, url, html_content, charset=None):
+    """Analyze a page and list its hrefs - module-level so worker processes can pickle it"""
+    if _worker_analyzers is None:
+        return PageAnalyzer(domain).analyze_page_with_links(url, html_content, charset)
+    
+    analyzer = _worker_analyzers.get(domain)
+    if analyzer is None:
+        if len(_worker_analyzers) >= WORKER_ANALYZER_LIMIT:
+            del _worker_analyzers[next(iter(_worker_analyzers))]
+        analyzer = _worker_analyzers[domain] = PageAnalyzer(domain)
+    return analyzer.analyze_page_with_links(url, html_content, charset)
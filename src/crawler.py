@@ -1,58 +1,184 @@
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import aiohttp
+from collections import deque
 from urllib.parse import urljoin, urlparse
-import time
-from .utils import is_valid_url, setup_session
+from .analyzer import analyze_page_task
+from .logging_config import get_logger
+from .utils import make_url_validator, setup_async_session
+
+logger = get_logger("crawler")
+
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# Only HTML is worth downloading, and only this much of it
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml')
+MAX_PAGE_BYTES = 2 * 1024 * 1024
+READ_CHUNK_SIZE = 64 * 1024
+
+def _same_host(url, host):
+    """Whether an absolute http(s) URL's netloc is exactly host, without parsing the URL"""
+    for scheme in ('http://', 'https://'):
+        if url.startswith(scheme) and url.startswith(host, len(scheme)):
+            end = len(scheme) + len(host)
+            return end == len(url) or url[end] in '/?#'
+    return False
+
+async def fetch_url(session, url):
+    """Fetch a single URL and return (raw HTML bytes, Content-Type charset or None),
+    or None if the request failed or isn't HTML"""
+    try:
+        async with session.get(url, timeout=REQUEST_TIMEOUT) as response:
+            response.raise_for_status()
+            
+            # Don't download images, PDFs etc. that happen to be linked like pages
+            if 'Content-Type' in response.headers and not response.content_type.startswith(HTML_CONTENT_TYPES):
+                logger.info("Skipping non-HTML page %s (%s)", url, response.content_type)
+                return None
+            
+            # Stream the body so a huge page can't stall the crawl or fill memory
+            body = bytearray()
+            async for chunk in response.content.iter_chunked(READ_CHUNK_SIZE):
+                body += chunk
+                if len(body) >= MAX_PAGE_BYTES:
+                    logger.warning("Truncating %s at %d bytes", url, MAX_PAGE_BYTES)
+                    del body[MAX_PAGE_BYTES:]
+                    break
+            
+            # Left undecoded - the parser reads the page's own charset declaration,
+            # falling back to the header's charset
+            return bytes(body), response.charset
+    except Exception as e:
+        logger.warning("Error crawling %s: %s", url, e)
+        return None
+
+async def fetch_many(session, urls, max_concurrency=20):
+    """Fetch URLs concurrently over one session, returning fetch_url's results in order"""
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def fetch_limited(url):
+        async with semaphore:
+            return await fetch_url(session, url)
+    
+    return await asyncio.gather(*(fetch_limited(url) for url in urls))
+
+class HostThrottle:
+    """Spaces out the start of requests to one host by a minimum interval"""
+    def __init__(self, interval):
+        self.interval = interval
+        self.lock = asyncio.Lock()
+        self.last_fetch_time = None
+
+    async def wait(self):
+        """Wait until this host may be sent another request"""
+        async with self.lock:
+            loop = asyncio.get_running_loop()
+            if self.last_fetch_time is not None:
+                remaining = self.last_fetch_time + self.interval - loop.time()
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
+            self.last_fetch_time = loop.time()
 
 class WebCrawler:
-    def __init__(self, base_url, max_pages=50, delay=1):
+    def __init__(self, base_url, max_pages=50, delay=1, max_concurrency=20, per_host_limit=1, executor=None,
+                 page_sink=None):
         self.base_url = base_url
         self.max_pages = max_pages
         self.delay = delay
-        self.session = setup_session()
+        self.max_concurrency = max_concurrency
+        self.per_host_limit = per_host_limit  # Requests open to one host at once; raise it explicitly for more
+        self.executor = executor  # Runs page analysis; None uses asyncio's default thread pool
+        self.page_sink = page_sink  # Opt-in writer given each PageAnalysis as its page finishes (completion order)
         self.visited_urls = set()
         self.domain = urlparse(base_url).netloc
-        
+        self.is_valid_url = make_url_validator(self.domain)  # Bound to this crawl's domain
+
+    async def _fetch_politely(self, session, url, host_throttles):
+        """Fetch a URL once its host's rate limit allows another request"""
+        host = urlparse(url).netloc
+        throttle = host_throttles.get(host)
+        if throttle is None:
+            # At most one request to each host every `delay` seconds
+            throttle = host_throttles[host] = HostThrottle(self.delay)
+
+        # Only the start of each request is spaced out; the connector caps
+        # how many are open to a host at once (limit_per_host)
+        await throttle.wait()
+        return await fetch_url(session, url)
+
+    async def _crawl_page(self, session, url, host_throttles):
+        """Fetch and analyze one page, returning (url, analysis, hrefs) or (url, None, None) if the fetch failed"""
+        page = await self._fetch_politely(session, url, host_throttles)
+        if page is None:
+            return url, None, None
+        html, charset = page
+
+        # Parsing happens once, in the executor, so it overlaps with other fetches
+        loop = asyncio.get_running_loop()
+        analysis, hrefs = await loop.run_in_executor(self.executor, analyze_page_task, self.domain, url, html, charset)
+        return url, analysis, hrefs
+
+    async def crawl_site_async(self):
+        """Crawl and analyze the site starting from base_url, returning (url, PageAnalysis) pairs"""
+        frontier = deque([self.base_url])
+        frontier_set = {self.base_url}  # Mirrors frontier for O(1) membership checks
+        crawled_pages = []
+        host_throttles = {}
+        in_flight = {}  # url -> fetch task
+        fetch_order = {}  # url -> position it was scheduled in, to return pages in BFS order
+
+        async with setup_async_session(self.max_concurrency, self.per_host_limit) as session:
+            while frontier or in_flight:
+                # Start fetches while there is room left in the page budget
+                while frontier and len(crawled_pages) + len(in_flight) < self.max_pages:
+                    current_url = frontier.popleft()
+                    frontier_set.discard(current_url)
+                    if current_url in self.visited_urls or current_url in in_flight:
+                        continue
+
+                    # Per-URL messages are debug-level; arguments are only formatted if enabled
+                    logger.debug("Crawling: %s", current_url)
+                    fetch_order[current_url] = len(fetch_order)
+                    in_flight[current_url] = asyncio.create_task(
+                        self._crawl_page(session, current_url, host_throttles)
+                    )
+
+                if not in_flight:
+                    break
+
+                done, _ = await asyncio.wait(in_flight.values(), return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    current_url, analysis, hrefs = task.result()
+                    del in_flight[current_url]
+
+                    if analysis is None:
+                        continue
+
+                    self.visited_urls.add(current_url)
+                    crawled_pages.append((current_url, analysis))
+                    if self.page_sink is not None:
+                        self.page_sink.append(analysis)
+
+                    # Find more pages to crawl
+                    for href in hrefs:
+                        full_url = urljoin(current_url, href)
+
+                        # Only crawl pages from same domain - the cheap host check
+                        # first, so off-site links never reach is_valid_url
+                        if (_same_host(full_url, self.domain) and
+                            self.is_valid_url(full_url) and
+                            full_url not in self.visited_urls and
+                            full_url not in in_flight and
+                            full_url not in frontier_set):
+                            frontier.append(full_url)
+                            frontier_set.add(full_url)
+
+        # Fetches finish out of order; report pages in the order they were found
+        crawled_pages.sort(key=lambda page: fetch_order[page[0]])
+
+        logger.info("Crawled %d pages", len(crawled_pages))
+        return crawled_pages
+
     def crawl_site(self):
         """Crawl the entire site starting from base_url"""
-        pages_to_crawl = [self.base_url]
-        crawled_pages = []
-        
-        while pages_to_crawl and len(crawled_pages) < self.max_pages:
-            current_url = pages_to_crawl.pop(0)
-            
-            if current_url in self.visited_urls:
-                continue
-                
-            print(f"Crawling: {current_url}")
-            
-            try:
-                # Add delay to be respectful
-                time.sleep(self.delay)
-                
-                response = self.session.get(current_url, timeout=10)
-                response.raise_for_status()
-                
-                self.visited_urls.add(current_url)
-                crawled_pages.append((current_url, response.text))
-                
-                # Find more pages to crawl
-                soup = BeautifulSoup(response.text, 'html.parser')
-                links = soup.find_all('a', href=True)
-                
-                for link in links:
-                    href = link['href']
-                    full_url = urljoin(current_url, href)
-                    
-                    # Only crawl pages from same domain
-                    if (is_valid_url(full_url, self.domain) and 
-                        full_url not in self.visited_urls and 
-                        full_url not in pages_to_crawl):
-                        pages_to_crawl.append(full_url)
-                        
-            except Exception as e:
-                print(f"Error crawling {current_url}: {e}")
-                continue
-        
-        print(f"Crawled {len(crawled_pages)} pages")
-        return crawled_pages
\ No newline at end of file
+        return asyncio.run(self.crawl_site_async())
\ No newline at end of file
@@ -3,22 +3,116 @@ import numpy as np
 from datetime import datetime
 import os
 from io import BytesIO
-import json
+import orjson
+import csv
+import gzip
+import io
+import dataclasses
+from collections import Counter
+from urllib.parse import urlsplit
+
+# Fixed category orders for issue columns, with score tables aligned to them
+ISSUE_TYPES = ['CRITICAL', 'WARNING', 'INFO']
+ISSUE_CATEGORIES = ['Title', 'Meta Description', 'Headers', 'Images', 'Content', 'Technical']
+
+# Priority scoring (unknown types score 0)
+PRIORITY_SCORES = np.array([10, 5, 1, 0], dtype=np.int8)
+
+# Category impact scoring (unknown categories score 1)
+CATEGORY_IMPACT = np.array([10, 9, 8, 4, 3, 6, 1], dtype=np.int8)
+
+# Letter grades from worst to best, and the fraction needed for each grade above F
+GRADE_LABELS = ('F', 'D', 'C', 'B', 'A')
+GRADE_CUTOFFS = np.array([0.6, 0.7, 0.8, 0.9])
+
+ISSUE_CATEGORICAL_COLUMNS = ('type', 'category', 'recommendation', 'issue')
+
+# Quick wins criteria - the alt text message starts with a count, so it's matched by its ending
+QUICK_WIN_ISSUES = frozenset({'Missing meta description', 'Missing H1 tag', 'Missing title tag'})
+QUICK_WIN_ISSUE_SUFFIX = 'images missing alt text'
+
+# Characters that make csv.writer quote a field
+CSV_SPECIAL_CHARACTERS = r'[,"\r\n]'
+
+def _csv_cells(column):
+    """A column's values as an object array of CSV fields, quoted where csv.writer would quote them"""
+    values = column.to_numpy(dtype=object)
+    missing = pd.isna(values)
+    if missing.any():
+        values = np.where(missing, '', values)
+    
+    # Numbers and booleans never need quoting; anything else is quoted by its text
+    if column.dtype.kind not in 'biuf':
+        text = pd.Series(values, dtype=object).astype(str)
+        needs_quotes = text.str.contains(CSV_SPECIAL_CHARACTERS).to_numpy(dtype=bool)
+        if needs_quotes.any():
+            quoted = '"' + text[needs_quotes].str.replace('"', '""', regex=False) + '"'
+            values = values.copy()
+            values[needs_quotes] = quoted.to_numpy(dtype=object)
+    return values
+
+def as_columns(records):
+    """Column lists for a DataFrame from dataclass rows; column dicts and dict rows pass through"""
+    # pandas converts each dataclass row with asdict, which deep-copies it;
+    # reading each field across all rows instead skips that per-row work
+    if isinstance(records, list) and records and dataclasses.is_dataclass(records[0]):
+        return {
+            field.name: [getattr(record, field.name) for record in records]
+            for field in dataclasses.fields(records[0])
+        }
+    return records
+
+# Writes go to disk in large blocks rather than the default 8 KiB
+WRITE_BUFFER_SIZE = 1 << 20
+CSV_CHUNK_ROWS = 10000
+
+def _open_csv(path, compresslevel=None):
+    """Open a CSV file for writing text, gzipped at compresslevel if one is given"""
+    if compresslevel is None:
+        return open(path, 'w', encoding='utf-8', newline='', buffering=WRITE_BUFFER_SIZE)
+    # A fixed mtime keeps the archive bytes the same for the same data
+    raw = gzip.GzipFile(path, 'wb', compresslevel=compresslevel, mtime=0)
+    return io.TextIOWrapper(raw, encoding='utf-8', newline='')
+
+def fast_to_csv(df, path, index=False, compresslevel=None):
+    """Write a DataFrame as CSV like DataFrame.to_csv, without its per-cell formatting"""
+    # Fields are prepared a whole column at a time, then the body is formatted
+    # by a single %-template over the flattened rows instead of row by row
+    columns = [df.index] if index else []
+    columns += [df[column] for column in df.columns]
+    header = ([df.index.name or ''] if index else []) + [str(column) for column in df.columns]
+    
+    with _open_csv(path, compresslevel) as f:
+        csv.writer(f, lineterminator=os.linesep).writerow(header)
+        if not columns or len(df) == 0:
+            return
+        
+        cells = np.column_stack([_csv_cells(column) for column in columns])
+        if len(columns) == 1:
+            # csv.writer quotes an empty field when it's the whole row
+            cells[cells == ''] = '""'
+        
+        # Formatted a block of rows at a time, so the text of a large table
+        # is never held in memory all at once next to its cells
+        row_template = ','.join(['%s'] * len(columns)) + os.linesep
+        for start in range(0, len(df), CSV_CHUNK_ROWS):
+            chunk = cells[start:start + CSV_CHUNK_ROWS]
+            f.write((row_template * len(chunk)) % tuple(chunk.ravel()))
 
 class EnhancedPandasReporter:
     def __init__(self, base_url):
         self.base_url = base_url
         self.timestamp = datetime.now().strftime('%Y%m%d_%H%M')
-        self.domain_name = base_url.replace('https://', '').replace('http://', '').replace('www.', '').split('/')[0]
+        # Host (and port) without a leading www. - a bare domain is parsed as if it had a scheme
+        netloc = urlsplit(base_url if '://' in base_url else f'//{base_url}').netloc
+        self.domain_name = netloc.removeprefix('www.')
         
         # Create reports directory structure
         self.reports_dir = "reports"
         self.backend_storage_dir = os.path.join(self.reports_dir, "backend_storage")
         self.scan_folder = os.path.join(self.backend_storage_dir, f"{self.domain_name}_{self.timestamp}")
         
-        # Ensure all directories exist
-        os.makedirs(self.reports_dir, exist_ok=True)
-        os.makedirs(self.backend_storage_dir, exist_ok=True)
+        # Ensure all directories exist - creating the scan folder creates its parents
         os.makedirs(self.scan_folder, exist_ok=True)
     
     def create_priority_matrix(self, issues_df):
@@ -26,93 +120,121 @@ class EnhancedPandasReporter:
         if issues_df.empty:
             return issues_df
         
-        # Priority scoring
-        priority_scores = {
-            'CRITICAL': 10,
-            'WARNING': 5,
-            'INFO': 1
-        }
-        
-        # Category impact scoring
-        category_impact = {
-            'Title': 10,
-            'Meta Description': 9,
-            'Headers': 8,
-            'Images': 4,
-            'Content': 3,
-            'Technical': 6
-        }
-        
-        issues_df['priority_score'] = issues_df['type'].map(priority_scores)
-        issues_df['category_impact'] = issues_df['category'].map(category_impact).fillna(1)
-        issues_df['total_score'] = issues_df['priority_score'] + issues_df['category_impact']
+        issues_df = self._score_issues(issues_df)
         
         # Sort by total score descending
-        issues_df = issues_df.sort_values('total_score', ascending=False)
+        issues_df = issues_df.sort_values('total_score', ascending=False, kind='stable')
         
         return issues_df
     
+    def _score_issues(self, issues_df):
+        """Add priority_score, category_impact and total_score columns, keeping row order"""
+        # Look scores up by categorical code instead of hashing every string;
+        # the last slot of each table is for values outside the categories (code -1)
+        type_codes = pd.Categorical(issues_df['type'], categories=ISSUE_TYPES).codes
+        category_codes = pd.Categorical(issues_df['category'], categories=ISSUE_CATEGORIES).codes
+        
+        priority_score = PRIORITY_SCORES[type_codes]
+        category_impact = CATEGORY_IMPACT[category_codes]
+        
+        # assign leaves the caller's frame untouched without copying its columns
+        return issues_df.assign(
+            priority_score=priority_score,
+            category_impact=category_impact,
+            total_score=priority_score + category_impact
+        )
+    
+    def _highest_scoring(self, issues_df, limit):
+        """The `limit` highest-scoring issues in priority order, without sorting them all"""
+        if 'total_score' not in issues_df.columns:
+            issues_df = self._score_issues(issues_df)
+        
+        scores = issues_df['total_score'].to_numpy(dtype=np.int64)
+        count = min(limit, len(scores))
+        if count == 0:
+            return issues_df.iloc[:0]
+        
+        # Higher score first, then earlier row - unique keys, so the partial
+        # selection picks exactly what a stable sort would put first
+        keys = -scores * len(scores) + np.arange(len(scores))
+        top = np.argpartition(keys, count - 1)[:count]
+        return issues_df.iloc[top[np.argsort(keys[top])]]
+    
     def create_page_summary(self, pages_df):
         """Create page-level summary with SEO scores"""
         if pages_df.empty:
             return pages_df
         
-        # Calculate SEO scores for each page
-        def calculate_page_score(row):
-            score = 0
-            max_score = 100
-            
-            # Title (25 points)
-            if row['title']:
-                if 30 <= row['title_length'] <= 60:
-                    score += 25
-                elif row['title_length'] > 0:
-                    score += 15
-            
-            # Meta Description (25 points)
-            if row['has_meta_description']:
-                if 120 <= row['meta_desc_length'] <= 160:
-                    score += 25
-                elif row['meta_desc_length'] > 0:
-                    score += 15
-            
-            # H1 Tag (20 points)
-            if row['h1_count'] == 1:
-                score += 20
-            elif row['h1_count'] > 0:
-                score += 10
-            
-            # Images (15 points)
-            if row['total_images'] > 0:
-                alt_coverage = (row['total_images'] - row['images_without_alt']) / row['total_images']
-                score += alt_coverage * 15
-            else:
-                score += 15  # No images = perfect score
-            
-            # Content (15 points)
-            if row['word_count'] >= 300:
-                score += 15
-            elif row['word_count'] >= 150:
-                score += 10
-            elif row['word_count'] > 0:
-                score += 5
-            
-            return min(score, max_score)
+        # Score whole columns at once instead of calling a Python function per row
+        title_length = pages_df['title_length'].to_numpy()
+        meta_desc_length = pages_df['meta_desc_length'].to_numpy()
+        has_meta = pages_df['has_meta_description'].to_numpy(dtype=bool)
+        h1_count = pages_df['h1_count'].to_numpy()
+        total_images = pages_df['total_images'].to_numpy()
+        images_without_alt = pages_df['images_without_alt'].to_numpy()
+        word_count = pages_df['word_count'].to_numpy()
+        
+        # Title (25 points) - title_length is 0 when there is no title
+        title_score = np.select(
+            [(title_length >= 30) & (title_length <= 60), title_length > 0], [25, 15], default=0
+        )
+        
+        # Meta Description (25 points)
+        meta_score = np.select(
+            [has_meta & (meta_desc_length >= 120) & (meta_desc_length <= 160), has_meta & (meta_desc_length > 0)],
+            [25, 15], default=0
+        )
+        
+        # H1 Tag (20 points)
+        h1_score = np.select([h1_count == 1, h1_count > 0], [20, 10], default=0)
+        
+        # Images (15 points) - no images = perfect score
+        alt_coverage = np.divide(
+            total_images - images_without_alt, total_images,
+            out=np.ones(len(pages_df)), where=total_images > 0
+        )
+        image_score = alt_coverage * 15
         
-        pages_df['seo_score'] = pages_df.apply(calculate_page_score, axis=1)
-        pages_df['grade'] = pages_df['seo_score'].apply(
-            lambda x: 'A' if x >= 90 else 'B' if x >= 80 else 'C' if x >= 70 else 'D' if x >= 60 else 'F'
+        # Content (15 points)
+        content_score = np.select(
+            [word_count >= 300, word_count >= 150, word_count > 0], [15, 10, 5], default=0
         )
         
-        return pages_df
+        seo_score = np.minimum(title_score + meta_score + h1_score + image_score + content_score, 100)
+        grade = pd.cut(
+            seo_score, bins=[-np.inf, 60, 70, 80, 90, np.inf],
+            labels=GRADE_LABELS, right=False
+        )
+        
+        # Returned as a new frame sharing the page columns, so callers don't need to copy
+        return pages_df.assign(seo_score=seo_score, grade=grade)
     
     def create_issue_summary(self, issues_df):
         """Create summary statistics by category and type"""
         if issues_df.empty:
             return pd.DataFrame()
         
-        summary = issues_df.groupby(['category', 'type']).size().reset_index(name='count')
-        summary_pivot = summary.pivot(index='category', columns='type', values='count').fillna(0)
+        # Count (category, type) pairs in one pass as a 2-D histogram over their codes
+        categories = pd.Categorical(issues_df['category'])
+        types = pd.Categorical(issues_df['type'])
+        category_codes = categories.codes.astype(np.int64)
+        type_codes = types.codes.astype(np.int64)
+        labelled = (category_codes >= 0) & (type_codes >= 0)
+        type_count = len(types.categories)
+        counts = np.bincount(
+            category_codes[labelled] * type_count + type_codes[labelled],
+            minlength=len(categories.categories) * type_count
+        ).reshape(-1, type_count)
+        
+        # Only categories and types that actually occur, with plain labels so
+        # TOTAL can be added and Priority maps to numbers not categories
+        occurring_categories = counts.sum(axis=1) > 0
+        occurring_types = counts.sum(axis=0) > 0
+        summary_pivot = pd.DataFrame(
+            counts[occurring_categories][:, occurring_types],
+            index=pd.Index(categories.categories[occurring_categories], dtype=object, name='category'),
+            columns=pd.Index(types.categories[occurring_types], dtype=object, name='type')
+        )
         
         # Calculate totals
         summary_pivot['TOTAL'] = summary_pivot.sum(axis=1)
@@ -128,39 +250,45 @@ class EnhancedPandasReporter:
         }
         
         summary_pivot['Priority'] = summary_pivot.index.map(category_priority).fillna(99)
-        summary_pivot = summary_pivot.sort_values('Priority')
+        summary_pivot = summary_pivot.sort_values('Priority', kind='stable')
         
         return summary_pivot
     
     def save_raw_data(self, pages_data, issues_data, scan_metadata=None):
         """Save raw scan data as JSON files for backend storage"""
         
+        # orjson writes the PageAnalysis dataclasses directly and is much faster than json;
+        # the bulk files are written compact, only the small metadata file is indented
+        options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        
         # Save pages data
         pages_file = os.path.join(self.scan_folder, f"pages_data_{self.domain_name}.json")
-        with open(pages_file, 'w', encoding='utf-8') as f:
-            json.dump(pages_data, f, indent=2, default=str, ensure_ascii=False)
+        with open(pages_file, 'wb') as f:
+            f.write(orjson.dumps(pages_data, default=str, option=options))
         
-        # Save issues data  
+        # Save issues data, one record per issue as before the columnar format
         issues_file = os.path.join(self.scan_folder, f"issues_data_{self.domain_name}.json")
-        with open(issues_file, 'w', encoding='utf-8') as f:
-            json.dump(issues_data, f, indent=2, default=str, ensure_ascii=False)
+        issue_records = [dict(zip(issues_data, row)) for row in zip(*issues_data.values())]
+        with open(issues_file, 'wb') as f:
+            f.write(orjson.dumps(issue_records, default=str, option=options))
         
         # Save scan metadata
         if scan_metadata is None:
+            type_counts = Counter(issues_data['type'])
             scan_metadata = {
                 'url': self.base_url,
                 'domain': self.domain_name,
                 'scan_timestamp': self.timestamp,
                 'scan_date': datetime.now().isoformat(),
                 'total_pages': len(pages_data),
-                'total_issues': len(issues_data),
-                'critical_issues': len([i for i in issues_data if i.get('type') == 'CRITICAL']),
-                'warning_issues': len([i for i in issues_data if i.get('type') == 'WARNING'])
+                'total_issues': len(issue_records),
+                'critical_issues': type_counts['CRITICAL'],
+                'warning_issues': type_counts['WARNING']
             }
         
         metadata_file = os.path.join(self.scan_folder, f"scan_metadata_{self.domain_name}.json")
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(scan_metadata, f, indent=2, default=str, ensure_ascii=False)
+        with open(metadata_file, 'wb') as f:
+            f.write(orjson.dumps(scan_metadata, default=str, option=options | orjson.OPT_INDENT_2))
         
         return {
             'pages_file': pages_file,
@@ -169,23 +297,25 @@ class EnhancedPandasReporter:
             'scan_folder': self.scan_folder
         }
     
-    def save_csv_reports(self, pages_df, issues_df):
+    def save_csv_reports(self, pages_df, issues_df, artifacts=None):
         """Save CSV versions of all data"""
+        if artifacts is None:
+            artifacts = self._compute_artifacts(pages_df, issues_df)
         
         # Save issues CSV
         issues_csv = os.path.join(self.scan_folder, f"issues_{self.domain_name}.csv")
-        issues_df.to_csv(issues_csv, index=False, encoding='utf-8')
+        fast_to_csv(issues_df, issues_csv)
         
         # Save pages CSV
         pages_csv = os.path.join(self.scan_folder, f"pages_{self.domain_name}.csv")
-        pages_df.to_csv(pages_csv, index=False, encoding='utf-8')
+        fast_to_csv(pages_df, pages_csv)
         
         # Save summary CSV
         if not issues_df.empty:
-            summary_df = self.create_issue_summary(issues_df)
+            summary_df = artifacts['issue_summary']
             if not summary_df.empty:
                 summary_csv = os.path.join(self.scan_folder, f"summary_{self.domain_name}.csv")
-                summary_df.to_csv(summary_csv, encoding='utf-8')
+                fast_to_csv(summary_df, summary_csv, index=True)
         
         return {
             'issues_csv': issues_csv,
@@ -198,9 +328,7 @@ class EnhancedPandasReporter:
         if issues_df.empty:
             return pd.DataFrame()
         
-        prioritized = self.create_priority_matrix(issues_df.copy())
-        
-        top_issues = prioritized.head(limit)[['category', 'issue', 'url', 'recommendation', 'type', 'total_score']]
+        top_issues = self._highest_scoring(issues_df, limit)[['category', 'issue', 'url', 'recommendation', 'type', 'total_score']]
         top_issues['rank'] = range(1, len(top_issues) + 1)
         
         # Reorder columns
@@ -213,91 +341,74 @@ class EnhancedPandasReporter:
         if issues_df.empty:
             return pd.DataFrame()
         
-        # Quick wins criteria
-        quick_win_patterns = [
-            'Missing meta description',
-            'Missing H1 tag',
-            'Missing title tag',
-            'images missing alt text'
-        ]
-        
+        # Quick wins are a fixed set of IssueDetector messages, so match them
+        # exactly instead of running a regex over every issue
         quick_wins = issues_df[
-            issues_df['issue'].str.contains('|'.join(quick_win_patterns), case=False, na=False)
-        ].copy()
+            issues_df['issue'].isin(QUICK_WIN_ISSUES) |
+            issues_df['issue'].str.endswith(QUICK_WIN_ISSUE_SUFFIX, na=False)
+        ]
         
         if not quick_wins.empty:
-            quick_wins = self.create_priority_matrix(quick_wins)
-            quick_wins = quick_wins.head(10)[['category', 'issue', 'url', 'recommendation']]
+            quick_wins = self._highest_scoring(quick_wins, 10)[['category', 'issue', 'url', 'recommendation']]
         
         return quick_wins
     
-    def create_excel_report(self, pages_df, issues_df):
+    def create_excel_report(self, pages_df, issues_df, artifacts=None):
         """Create comprehensive Excel report with multiple sheets"""
         excel_file = os.path.join(self.scan_folder, f"SEO_Analysis_{self.domain_name}.xlsx")
-        
-        with pd.ExcelWriter(excel_file, engine='openpyxl') as writer:
-            
-            # Sheet 1: Executive Summary
-            summary_data = self.create_executive_summary(pages_df, issues_df)
-            summary_df = pd.DataFrame(summary_data)
-            summary_df.to_excel(writer, sheet_name='Executive Summary', index=False)
-            
-            # Sheet 2: Top Issues (Action Items)
-            top_issues = self.create_top_issues_list(issues_df)
-            if not top_issues.empty:
-                top_issues.to_excel(writer, sheet_name='Top Issues', index=False)
-            
-            # Sheet 3: Quick Wins
-            quick_wins = self.create_quick_wins(issues_df)
-            if not quick_wins.empty:
-                quick_wins.to_excel(writer, sheet_name='Quick Wins', index=False)
-            
-            # Sheet 4: Page Analysis
-            page_summary = self.create_page_summary(pages_df.copy())
-            key_columns = ['url', 'seo_score', 'grade', 'title_length', 'has_meta_description', 
-                          'h1_count', 'total_images', 'images_without_alt', 'word_count']
-            if all(col in page_summary.columns for col in key_columns):
-                page_summary[key_columns].to_excel(writer, sheet_name='Page Analysis', index=False)
-            else:
-                page_summary.to_excel(writer, sheet_name='Page Analysis', index=False)
-            
-            # Sheet 5: Issues by Category
-            issue_summary = self.create_issue_summary(issues_df)
-            if not issue_summary.empty:
-                issue_summary.to_excel(writer, sheet_name='Issues by Category')
-            
-            # Sheet 6: All Issues (Raw Data)
-            if not issues_df.empty:
-                issues_df.to_excel(writer, sheet_name='All Issues', index=False)
-            
-            # Sheet 7: All Pages (Raw Data)
-            pages_df.to_excel(writer, sheet_name='All Pages', index=False)
-        
+        self._write_excel(excel_file, pages_df, issues_df, artifacts)
         return excel_file
     
-    def create_excel_download_buffer(self, pages_df, issues_df):
+    def create_excel_download_buffer(self, pages_df, issues_df, artifacts=None):
         """Create Excel report in memory buffer for download"""
         buffer = BytesIO()
+        self._write_excel(buffer, pages_df, issues_df, artifacts)
+        buffer.seek(0)
+        return buffer
+    
+    def _compute_artifacts(self, pages_df, issues_df):
+        """Build the derived report tables once so every output can share them"""
+        # Score the issues once for both the top issues and quick wins; each
+        # only needs its few highest-scoring rows, so neither sorts them all
+        scored = issues_df if issues_df.empty else self._score_issues(issues_df)
         
-        with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
+        return {
+            'exec_summary': pd.DataFrame(self.create_executive_summary(pages_df, issues_df)),
+            'top_issues': self.create_top_issues_list(scored),
+            'quick_wins': self.create_quick_wins(scored),
+            # generate_reports has already scored its pages
+            'page_summary': pages_df if 'seo_score' in pages_df.columns else self.create_page_summary(pages_df),
+            'issue_summary': self.create_issue_summary(issues_df)
+        }
+    
+    def _write_excel(self, target, pages_df, issues_df, artifacts=None):
+        """Write the multi-sheet Excel report to a file path or buffer"""
+        if artifacts is None:
+            artifacts = self._compute_artifacts(pages_df, issues_df)
+        
+        # xlsxwriter writes cells straight out instead of building an openpyxl
+        # cell tree first. Its constant_memory mode is not used because pandas
+        # writes cells column by column, which that mode drops. URLs stay plain
+        # text, as openpyxl wrote them, rather than becoming hyperlink objects.
+        with pd.ExcelWriter(target, engine='xlsxwriter',
+                            engine_kwargs={'options': {'strings_to_urls': False}}) as writer:
             
             # Sheet 1: Executive Summary
-            summary_data = self.create_executive_summary(pages_df, issues_df)
-            summary_df = pd.DataFrame(summary_data)
+            summary_df = artifacts['exec_summary']
             summary_df.to_excel(writer, sheet_name='Executive Summary', index=False)
             
             # Sheet 2: Top Issues (Action Items)
-            top_issues = self.create_top_issues_list(issues_df)
+            top_issues = artifacts['top_issues']
             if not top_issues.empty:
                 top_issues.to_excel(writer, sheet_name='Top Issues', index=False)
             
             # Sheet 3: Quick Wins
-            quick_wins = self.create_quick_wins(issues_df)
+            quick_wins = artifacts['quick_wins']
             if not quick_wins.empty:
                 quick_wins.to_excel(writer, sheet_name='Quick Wins', index=False)
             
             # Sheet 4: Page Analysis
-            page_summary = self.create_page_summary(pages_df.copy())
+            page_summary = artifacts['page_summary']
             key_columns = ['url', 'seo_score', 'grade', 'title_length', 'has_meta_description', 
                           'h1_count', 'total_images', 'images_without_alt', 'word_count']
             if all(col in page_summary.columns for col in key_columns):
@@ -306,7 +417,7 @@ class EnhancedPandasReporter:
                 page_summary.to_excel(writer, sheet_name='Page Analysis', index=False)
             
             # Sheet 5: Issues by Category
-            issue_summary = self.create_issue_summary(issues_df)
+            issue_summary = artifacts['issue_summary']
             if not issue_summary.empty:
                 issue_summary.to_excel(writer, sheet_name='Issues by Category')
             
@@ -316,22 +427,22 @@ class EnhancedPandasReporter:
             
             # Sheet 7: All Pages (Raw Data)
             pages_df.to_excel(writer, sheet_name='All Pages', index=False)
-        
-        buffer.seek(0)
-        return buffer
     
     def create_executive_summary(self, pages_df, issues_df):
         """Create executive summary data"""
         total_pages = len(pages_df)
-        critical_issues = len(issues_df[issues_df['type'] == 'CRITICAL']) if not issues_df.empty else 0
-        warning_issues = len(issues_df[issues_df['type'] == 'WARNING']) if not issues_df.empty else 0
+        critical_issues, warning_issues = self._count_issue_types(issues_df)
         
-        # Calculate metrics
-        pages_with_title = pages_df['title'].notna().sum() if not pages_df.empty else 0
-        pages_with_meta = pages_df['has_meta_description'].sum() if not pages_df.empty else 0
-        pages_with_h1 = (pages_df['h1_count'] > 0).sum() if not pages_df.empty else 0
-        total_images = pages_df['total_images'].sum() if not pages_df.empty else 0
-        images_without_alt = pages_df['images_without_alt'].sum() if not pages_df.empty else 0
+        # Calculate metrics - the plain column totals come from one sum over the block
+        if pages_df.empty:
+            pages_with_title = pages_with_meta = pages_with_h1 = total_images = images_without_alt = 0
+        else:
+            pages_with_meta, total_images, images_without_alt = (
+                pages_df[['has_meta_description', 'total_images', 'images_without_alt']]
+                .to_numpy(dtype=np.int64).sum(axis=0)
+            )
+            pages_with_title = pages_df['title'].notna().sum()
+            pages_with_h1 = np.count_nonzero(pages_df['h1_count'].to_numpy() > 0)
         
         # Calculate scores
         avg_seo_score = pages_df['seo_score'].mean() if 'seo_score' in pages_df.columns else 0
@@ -355,21 +466,22 @@ class EnhancedPandasReporter:
         
         return summary_data
     
+    def _count_issue_types(self, issues_df):
+        """Number of CRITICAL and WARNING issues, from one value_counts instead of a filter each"""
+        if issues_df.empty:
+            return 0, 0
+        type_counts = issues_df['type'].value_counts()
+        return type_counts.get('CRITICAL', 0), type_counts.get('WARNING', 0)
+    
     def _get_grade(self, percentage):
         """Convert percentage to letter grade"""
-        if percentage >= 0.9:
-            return 'A'
-        elif percentage >= 0.8:
-            return 'B'
-        elif percentage >= 0.7:
-            return 'C'
-        elif percentage >= 0.6:
-            return 'D'
-        else:
-            return 'F'
+        # The grade is the number of cutoffs reached; NaN reaches none, so it's an F
+        return GRADE_LABELS[np.count_nonzero(percentage >= GRADE_CUTOFFS)]
     
-    def create_console_report(self, pages_df, issues_df):
+    def create_console_report(self, pages_df, issues_df, artifacts=None):
         """Create enhanced console output"""
+        if artifacts is None:
+            artifacts = self._compute_artifacts(pages_df, issues_df)
         
         print("\n" + "="*80)
         print(f"📊 ENHANCED SEO ANALYSIS - {self.domain_name.upper()}")
@@ -377,8 +489,7 @@ class EnhancedPandasReporter:
         
         # Quick stats
         total_pages = len(pages_df)
-        critical_count = len(issues_df[issues_df['type'] == 'CRITICAL']) if not issues_df.empty else 0
-        warning_count = len(issues_df[issues_df['type'] == 'WARNING']) if not issues_df.empty else 0
+        critical_count, warning_count = self._count_issue_types(issues_df)
         
         print(f"📅 Scan Date: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
         print(f"📄 Pages Analyzed: {total_pages}")
@@ -389,7 +500,7 @@ class EnhancedPandasReporter:
         if not issues_df.empty:
             print(f"\n🎯 TOP 5 PRIORITY FIXES:")
             print("-" * 50)
-            top_issues = self.create_top_issues_list(issues_df, limit=5)
+            top_issues = artifacts['top_issues'].head(5)
             for _, issue in top_issues.iterrows():
                 print(f"{issue['rank']}. {issue['category']}: {issue['issue']}")
                 url_display = issue['url'][:60] + '...' if len(issue['url']) > 60 else issue['url']
@@ -397,7 +508,7 @@ class EnhancedPandasReporter:
                 print(f"   💡 {issue['recommendation']}\n")
         
         # Quick Wins
-        quick_wins = self.create_quick_wins(issues_df)
+        quick_wins = artifacts['quick_wins']
         if not quick_wins.empty:
             print(f"⚡ QUICK WINS (Easy fixes with high impact):")
             print("-" * 50)
@@ -411,23 +522,37 @@ class EnhancedPandasReporter:
         """Main function to generate all reports with backend storage"""
         
         # Convert to DataFrames
-        pages_df = pd.DataFrame(pages_data)
+        pages_df = pd.DataFrame(as_columns(pages_data))
         issues_df = pd.DataFrame(issues_data)
         
+        # Page counts are small non-negative ints; store each in the narrowest
+        # unsigned type that holds its values instead of int64
+        for col in pages_df.select_dtypes('integer').columns:
+            pages_df[col] = pd.to_numeric(pages_df[col], downcast='unsigned')
+        
+        # Issue columns repeat a handful of strings; categoricals store them once
+        # and let groupby work on integer codes
+        for col in ISSUE_CATEGORICAL_COLUMNS:
+            if col in issues_df.columns:
+                issues_df[col] = issues_df[col].astype('category')
+        
         # Add SEO scores to pages
         pages_df = self.create_page_summary(pages_df)
         
+        # Derived tables shared by the CSV, Excel and console reports
+        artifacts = self._compute_artifacts(pages_df, issues_df)
+        
         # Save raw data to backend storage
         raw_files = self.save_raw_data(pages_data, issues_data, scan_metadata)
         
         # Save CSV reports
-        csv_files = self.save_csv_reports(pages_df, issues_df)
+        csv_files = self.save_csv_reports(pages_df, issues_df, artifacts)
         
         # Create Excel report (also saved to backend)
-        excel_file = self.create_excel_report(pages_df, issues_df)
+        excel_file = self.create_excel_report(pages_df, issues_df, artifacts)
         
         # Print enhanced console report
-        self.create_console_report(pages_df, issues_df)
+        self.create_console_report(pages_df, issues_df, artifacts)
         
         print(f"\n📊 Comprehensive Excel report saved to: {excel_file}")
         print(f"💾 Backend storage folder: {self.scan_folder}")
@@ -2,6 +2,12 @@ import logging
 import os
 from datetime import datetime
 from pathlib import Path
+import atexit
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+# Writes queued log records to the real handlers; started by the first setup_logging call
+_queue_listener = None
 
 def setup_logging(log_level="INFO", log_file=None):
     """
@@ -22,15 +28,27 @@ def setup_logging(log_level="INFO", log_file=None):
     # Get log level from environment or parameter
     level = getattr(logging, os.getenv("LOG_LEVEL", log_level).upper(), logging.INFO)
     
-    # Configure root logger
-    logging.basicConfig(
-        level=level,
-        format=log_format,
-        handlers=[
-            logging.FileHandler(log_file),
+    # Configure root logger - like basicConfig, only if nothing has configured it yet
+    root_logger = logging.getLogger()
+    if not root_logger.handlers:
+        formatter = logging.Formatter(log_format)
+        handlers = [
+            logging.FileHandler(log_file, delay=True),
             logging.StreamHandler()  # Also log to console
         ]
-    )
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        
+        # Loggers only put records on a queue; a listener thread does the
+        # formatting and file/console writes away from the scan
+        global _queue_listener
+        log_queue = queue.SimpleQueue()
+        _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _queue_listener.start()
+        atexit.register(_queue_listener.stop)  # Flushes queued records on exit
+        
+        root_logger.addHandler(QueueHandler(log_queue))
+        root_logger.setLevel(level)
     
     # Configure specific loggers
     
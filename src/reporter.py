@@ -4,34 +4,184 @@ Report generation for SEO Scanner
 Creates organized, readable reports in dedicated folder
 """
 
-import pandas as pd
+import dataclasses
 from datetime import datetime
 import os
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor
+
+# pandas and pyarrow are imported where tables are written, so creating a
+# reporter (or importing this module) doesn't pay for loading them
+
+# Rows buffered by StreamingTableWriter before each record batch is written
+STREAM_BATCH_ROWS = 1024
+
+# Arrow type factories (pyarrow function names) for the field annotations PageAnalysis uses
+ARROW_FIELD_TYPES = {str: 'string', int: 'int64', bool: 'bool_', float: 'float64'}
+
+class StreamingTableWriter:
+    """Appends rows to a feather (Arrow IPC) file in batches, so a crawl's rows never all sit in memory"""
+    def __init__(self, path, batch_rows=STREAM_BATCH_ROWS):
+        self.path = path
+        self.batch_rows = batch_rows
+        self.schema = None
+        self.writer = None
+        self.columns = None  # column name -> values buffered since the last batch
+        self.buffered = 0
+    
+    def append(self, row):
+        """Add one row - a dataclass such as PageAnalysis, or a dict"""
+        if self.columns is None:
+            self._start(row)
+        get_value = row.get if isinstance(row, dict) else lambda name: getattr(row, name)
+        for name, values in self.columns.items():
+            values.append(get_value(name))
+        self.buffered += 1
+        if self.buffered >= self.batch_rows:
+            self.flush()
+    
+    def _start(self, row):
+        """Fix the columns and schema from the first row; dataclass fields give exact types"""
+        import pyarrow as pa
+        
+        if dataclasses.is_dataclass(row):
+            fields = dataclasses.fields(row)
+            self.columns = {field.name: [] for field in fields}
+            if all(field.type in ARROW_FIELD_TYPES for field in fields):
+                self.schema = pa.schema([
+                    (field.name, getattr(pa, ARROW_FIELD_TYPES[field.type])()) for field in fields
+                ])
+        else:
+            self.columns = {name: [] for name in row}
+    
+    def flush(self):
+        """Write the buffered rows as one record batch and empty the buffers for reuse"""
+        if not self.buffered:
+            return
+        import pyarrow as pa
+        
+        if self.schema is None:
+            # Without dataclass types, the first batch's inferred types are kept for the rest.
+            # A column that is all None so far is inferred as null, which no later value
+            # fits, so it is widened to string
+            inferred = pa.RecordBatch.from_pydict(self.columns).schema
+            self.schema = pa.schema([
+                field.with_type(pa.string()) if pa.types.is_null(field.type) else field
+                for field in inferred
+            ])
+        
+        batch = pa.RecordBatch.from_pydict(self.columns, schema=self.schema)
+        if self.writer is None:
+            options = pa.ipc.IpcWriteOptions(compression=pa.Codec('zstd', compression_level=1))
+            self.writer = pa.ipc.new_file(self.path, self.schema, options=options)
+        self.writer.write_batch(batch)
+        for values in self.columns.values():
+            values.clear()
+        self.buffered = 0
+    
+    def close(self):
+        """Write any remaining rows and finish the file (none is created if no rows were appended)"""
+        self.flush()
+        if self.writer is not None:
+            self.writer.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
 class SEOReporter:
     def __init__(self, base_url):
         self.base_url = base_url
         self.timestamp = datetime.now().strftime('%Y%m%d_%H%M')
-        self.domain_name = base_url.replace('https://', '').replace('http://', '').replace('www.', '').split('/')[0]
+        # Host (and port) without a leading www. - a bare domain is parsed as if it had a scheme
+        netloc = urlsplit(base_url if '://' in base_url else f'//{base_url}').netloc
+        self.domain_name = netloc.removeprefix('www.')
         
         # Create reports directory
         self.reports_dir = "reports"
         os.makedirs(self.reports_dir, exist_ok=True)
     
-    def save_results(self, pages_data, issues):
-        """Save basic results - simplified version"""
-        scan_folder = os.path.join(self.reports_dir, f"{self.domain_name}_{self.timestamp}")
-        os.makedirs(scan_folder, exist_ok=True)
+    def save_results(self, pages_data, issues, file_format='feather', compress=False):
+        """Save basic results - simplified version, as feather files or CSV with file_format='csv'
+        (gzipped with compress=True)"""
+        import pandas as pd
+        from .enhanced_pandas_reporter import as_columns, ISSUE_CATEGORICAL_COLUMNS
+        from .utils import validate_title_lengths, validate_meta_description_lengths
+        
+        scan_folder = self._make_scan_folder()
+        
+        # Either PageAnalysis rows or column lists; columns (as IssueDetector
+        # returns issues) are the cheapest to build a DataFrame from
+        df_pages = pd.DataFrame(as_columns(pages_data))
+        df_issues = pd.DataFrame(as_columns(issues))
+        
+        # Length checks for every page in one pass over each column
+        if 'title' in df_pages.columns:
+            df_pages['title_status'], df_pages['title_message'] = validate_title_lengths(df_pages['title'])
+        if 'meta_description' in df_pages.columns:
+            df_pages['meta_description_status'], df_pages['meta_description_message'] = (
+                validate_meta_description_lengths(df_pages['meta_description'])
+            )
         
-        # Save page data
-        df_pages = pd.DataFrame(pages_data)
-        pages_file = os.path.join(scan_folder, "detailed_page_data.csv")
-        df_pages.to_csv(pages_file, index=False)
+        # Issue fields and statuses repeat a few strings; as categoricals, feather
+        # stores each once and the rows as small dictionary codes (CSV text is unchanged)
+        for df, columns in ((df_issues, ISSUE_CATEGORICAL_COLUMNS),
+                            (df_pages, ('title_status', 'meta_description_status'))):
+            for col in columns:
+                if col in df.columns:
+                    df[col] = df[col].astype('category')
         
-        # Save issues
-        df_issues = pd.DataFrame(issues)
-        issues_file = os.path.join(scan_folder, "issues_list.csv")
-        df_issues.to_csv(issues_file, index=False)
+        tables = ((df_pages, "detailed_page_data"), (df_issues, "issues_list"))
+        if file_format != 'csv' or compress:
+            # Arrow's zstd and gzip's zlib release the GIL while compressing, so the
+            # two tables are written side by side; result() re-raises any failure
+            with ThreadPoolExecutor(max_workers=len(tables)) as executor:
+                futures = [
+                    executor.submit(self._save_table, df, os.path.join(scan_folder, name), file_format, compress)
+                    for df, name in tables
+                ]
+            for future in futures:
+                future.result()
+        else:
+            # Plain CSV is formatted in Python and holds the GIL throughout,
+            # so a second thread would only add switching overhead
+            for df, name in tables:
+                self._save_table(df, os.path.join(scan_folder, name), file_format, compress)
         
         print(f"Reports saved in: {scan_folder}")
-        return scan_folder
\ No newline at end of file
+        return scan_folder
+    
+    def open_streaming(self, name="streamed_page_data"):
+        """Open a StreamingTableWriter for <name>.feather in the scan folder, to append rows
+        as they are produced instead of passing a full list to save_results (the default
+        name differs from save_results' files so the two never overwrite each other)"""
+        return StreamingTableWriter(os.path.join(self._make_scan_folder(), f"{name}.feather"))
+    
+    def _make_scan_folder(self):
+        """Create this scan's report folder if needed and return its path"""
+        scan_folder = os.path.join(self.reports_dir, f"{self.domain_name}_{self.timestamp}")
+        os.makedirs(scan_folder, exist_ok=True)
+        return scan_folder
+    
+    def _save_table(self, df, base_path, file_format, compress):
+        """Write one table to base_path plus the extension for its format"""
+        from .enhanced_pandas_reporter import fast_to_csv
+        import pyarrow as pa
+        import pyarrow.feather as feather
+        
+        if file_format == 'csv':
+            # Same file as DataFrame.to_csv, formatted a column at a time; gzip level 1
+            # costs far less CPU than the default level 9 for nearly the same size
+            if compress:
+                fast_to_csv(df, f"{base_path}.csv.gz", compresslevel=1)
+            else:
+                fast_to_csv(df, f"{base_path}.csv")
+        else:
+            # Arrow writes the columns as binary buffers instead of formatting each cell as text
+            feather.write_feather(
+                pa.Table.from_pandas(df, preserve_index=False),
+                f"{base_path}.feather",
+                compression='zstd', compression_level=1
+            )
\ No newline at end of file
@@ -0,0 +1,167 @@
+import re
+
+def _minify_css(css):
+    """Strip comments and collapse whitespace in a CSS block"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+    css = re.sub(r'\s+', ' ', css)
+    return re.sub(r'\s*([{};])\s*', r'\1', css).strip()
+
+# Custom CSS for professional look, minified once when first imported - Streamlit reruns
+# app.py on every interaction, but imported modules stay loaded between reruns
+CUSTOM_CSS = _minify_css("""
+<style>
+    /* Hide Streamlit branding */
+    #MainMenu {visibility: hidden;}
+    footer {visibility: hidden;}
+    header {visibility: hidden;}
+    .stDeployButton {display: none;}
+    
+    /* Global styling */
+    .stApp {
+        background: #f8fafc;
+    }
+    
+    .main .block-container {
+        padding-top: 2rem;
+        max-width: 1200px;
+    }
+    
+    /* Hero section */
+    .hero {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        padding: 3rem 2rem;
+        text-align: center;
+        color: white;
+        margin-bottom: 2rem;
+        border-radius: 16px;
+        box-shadow: 0 8px 32px rgba(0,0,0,0.1);
+    }
+    
+    .hero h1 {
+        font-size: 2.5rem;
+        font-weight: 700;
+        margin: 0 0 1rem 0;
+        font-family: 'Inter', -apple-system, sans-serif;
+    }
+    
+    .hero p {
+        font-size: 1.2rem;
+        opacity: 0.95;
+        margin: 0;
+        font-family: 'Inter', -apple-system, sans-serif;
+    }
+    
+    /* Cards and sections */
+    .metric-card {
+        background: white;
+        padding: 1.5rem;
+        border-radius: 12px;
+        box-shadow: 0 4px 20px rgba(0,0,0,0.08);
+        border: 1px solid #e2e8f0;
+        text-align: center;
+        margin-bottom: 1rem;
+    }
+    
+    .metric-card h3 {
+        margin: 0 0 0.5rem 0;
+        font-size: 2rem;
+        font-weight: 700;
+        color: #1a202c;
+    }
+    
+    .metric-card p {
+        margin: 0;
+        color: #64748b;
+        font-weight: 500;
+    }
+    
+    .metric-grid {
+        display: flex;
+        gap: 1rem;
+    }
+    
+    .metric-grid .metric-card {
+        flex: 1;
+    }
+    
+    .critical { color: #dc2626; }
+    .warning { color: #ea580c; }
+    .good { color: #059669; }
+    
+    /* Issue cards */
+    .issue-card {
+        background: white;
+        padding: 1.5rem;
+        border-radius: 12px;
+        box-shadow: 0 2px 8px rgba(0,0,0,0.06);
+        border-left: 4px solid #dc2626;
+        margin-bottom: 1rem;
+    }
+    
+    .issue-card.warning {
+        border-left-color: #ea580c;
+    }
+    
+    .issue-card h4 {
+        margin: 0 0 0.5rem 0;
+        color: #1a202c;
+        font-size: 1.1rem;
+    }
+    
+    .issue-card .url {
+        color: #64748b;
+        font-size: 0.9rem;
+        margin-bottom: 0.5rem;
+    }
+    
+    .issue-card .recommendation {
+        color: #059669;
+        font-weight: 500;
+        margin-top: 0.5rem;
+    }
+    
+    /* Sidebar styling */
+    .sidebar .sidebar-content {
+        background: white;
+        border-radius: 12px;
+        padding: 1.5rem;
+        margin-bottom: 1rem;
+        box-shadow: 0 2px 8px rgba(0,0,0,0.06);
+    }
+    
+    /* Button styling */
+    .stButton > button {
+        width: 100%;
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 0.75rem 1.5rem;
+        font-weight: 600;
+        transition: all 0.3s ease;
+    }
+    
+    .stButton > button:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 8px 25px rgba(102, 126, 234, 0.4);
+    }
+    
+    /* Progress bar styling */
+    .stProgress .st-bo {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    }
+    
+    /* Input styling */
+    .stTextInput > div > div > input {
+        border: 2px solid #e2e8f0;
+        border-radius: 8px;
+        padding: 0.75rem;
+        font-size: 1rem;
+    }
+    
+    .stTextInput > div > div > input:focus {
+        border-color: #667eea;
+        box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
+    }
+</style>
+""")
@@ -1,7 +1,116 @@
+import aiohttp
 import requests
-from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlparse, urlsplit
+from functools import lru_cache
 import re
 
+# Headers sent by every crawler request (sync and async)
+DEFAULT_HEADERS = {
+    'User-Agent': 'SEO-Scanner/1.0 (SEO Analysis Tool; +https://github.com/yourusername/seo-scanner)',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+# Compiled once here rather than looked up in re's cache on every call
+_WHITESPACE_RE = re.compile(r'\s+')
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x84\x86-\x9f]')
+
+# File extensions that aren't pages
+SKIP_EXTENSIONS = frozenset({
+    '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
+    '.zip', '.rar', '.tar', '.gz', '.exe', '.dmg',
+    '.jpg', '.jpeg', '.png', '.gif', '.svg', '.ico',
+    '.mp3', '.mp4', '.avi', '.mov', '.wmv',
+    '.css', '.js', '.xml', '.rss'
+})
+
+# Substrings of URLs that aren't worth crawling
+SKIP_PATTERNS = (
+    '/wp-admin/', '/admin/', '/login/', '/logout/',
+    '/wp-content/', '/wp-includes/',
+    'mailto:', 'tel:', 'ftp:', 'file:',
+    '#', 'javascript:'
+)
+
+@lru_cache(maxsize=256)
+def normalize_url(url):
+    """
+    Normalize a user-entered URL, defaulting to https://
+    
+    Args:
+        url (str): URL as typed, with or without a scheme
+    
+    Returns:
+        str: Normalized URL, or None if it has no host
+    """
+    url = url.strip()
+    if not url.startswith(('http://', 'https://')):
+        url = 'https://' + url
+    parts = urlsplit(url)
+    return parts.geturl() if parts.netloc else None
+
+def _http_netloc(url):
+    """The netloc of a plain http(s) URL found by slicing, or None where only urlparse can be trusted"""
+    if url.startswith('http://'):
+        start = 7
+    elif url.startswith('https://'):
+        start = 8
+    else:
+        return None
+    
+    # urlparse drops tabs and newlines anywhere, validates bracketed IPv6 hosts
+    # and normalizes non-ASCII hosts - leave those URLs to it
+    if '\t' in url or '\r' in url or '\n' in url:
+        return None
+    
+    # The netloc runs to the first '/', '?' or '#'
+    end = len(url)
+    for delimiter in '/?#':
+        position = url.find(delimiter, start, end)
+        if position >= 0:
+            end = position
+    netloc = url[start:end]
+    if '[' in netloc or ']' in netloc or not netloc.isascii():
+        return None
+    return netloc
+
+def _url_netloc(url):
+    """The netloc of a valid http(s) URL, or '' when it has no scheme, no netloc or another scheme"""
+    # Crawled links are almost always plain http(s) URLs, which don't need
+    # a full parse just to find their netloc
+    netloc = _http_netloc(url)
+    if netloc is not None:
+        return netloc
+    
+    parsed = urlparse(url)
+    
+    # Basic URL validation
+    if not parsed.netloc or not parsed.scheme:
+        return ''
+    
+    # Check if it's HTTP/HTTPS
+    if parsed.scheme not in ['http', 'https']:
+        return ''
+    
+    return parsed.netloc
+
+def _is_page_url(url):
+    """Whether a URL doesn't point at a file or a section of a site that isn't worth crawling"""
+    # Skip common file extensions that aren't pages - every extension has
+    # exactly one dot, so the URL ends with one iff its last '.' suffix is one
+    url_lower = url.lower()
+    if url_lower[url_lower.rfind('.'):] in SKIP_EXTENSIONS:
+        return False
+    
+    # Skip common non-page patterns
+    return not any(pattern in url_lower for pattern in SKIP_PATTERNS)
+
+@lru_cache(maxsize=4096)
 def is_valid_url(url, allowed_domain=None):
     """
     Validate if URL is valid and optionally check domain
@@ -14,49 +123,39 @@ def is_valid_url(url, allowed_domain=None):
         bool: True if URL is valid
     """
     try:
-        parsed = urlparse(url)
-        
-        # Basic URL validation
-        if not parsed.netloc or not parsed.scheme:
-            return False
-        
-        # Check if it's HTTP/HTTPS
-        if parsed.scheme not in ['http', 'https']:
+        netloc = _url_netloc(url)
+        if not netloc:
             return False
         
         # Check domain if specified
-        if allowed_domain and parsed.netloc != allowed_domain:
-            return False
-        
-        # Skip common file extensions that aren't pages
-        skip_extensions = [
-            '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
-            '.zip', '.rar', '.tar', '.gz', '.exe', '.dmg',
-            '.jpg', '.jpeg', '.png', '.gif', '.svg', '.ico',
-            '.mp3', '.mp4', '.avi', '.mov', '.wmv',
-            '.css', '.js', '.xml', '.rss'
-        ]
-        
-        url_lower = url.lower()
-        if any(url_lower.endswith(ext) for ext in skip_extensions):
+        if allowed_domain and netloc != allowed_domain:
             return False
         
-        # Skip common non-page patterns
-        skip_patterns = [
-            '/wp-admin/', '/admin/', '/login/', '/logout/',
-            '/wp-content/', '/wp-includes/',
-            'mailto:', 'tel:', 'ftp:', 'file:',
-            '#', 'javascript:'
-        ]
-        
-        if any(pattern in url_lower for pattern in skip_patterns):
-            return False
-        
-        return True
+        return _is_page_url(url)
         
     except Exception:
         return False
 
+def make_url_validator(allowed_domain, cache_size=100_000):
+    """
+    Build an is_valid_url for one crawl, with allowed_domain fixed and its own cache
+    
+    Args:
+        allowed_domain (str): Only allow URLs from this domain
+        cache_size (int): Most URL verdicts to remember
+    
+    Returns:
+        callable: Function taking a URL and returning True if it is valid
+    """
+    @lru_cache(maxsize=cache_size)
+    def is_valid(url):
+        try:
+            return _url_netloc(url) == allowed_domain and _is_page_url(url)
+        except Exception:
+            return False
+    
+    return is_valid
+
 def setup_session():
     """
     Setup a requests session with appropriate headers and settings
@@ -67,20 +166,48 @@ def setup_session():
     session = requests.Session()
     
     # Set user agent to identify as a legitimate crawler
-    session.headers.update({
-        'User-Agent': 'SEO-Scanner/1.0 (SEO Analysis Tool; +https://github.com/yourusername/seo-scanner)',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-    })
+    session.headers.update(DEFAULT_HEADERS)
     
     # Set timeout and retry strategy
     session.timeout = 10
     
+    # Retry dropped connections and transient server errors on idempotent requests;
+    # once retries run out the last response is returned rather than raised
+    retry = Retry(
+        total=3, backoff_factor=0.3,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        raise_on_status=False
+    )
+    
+    # Reuse keep-alive connections to the crawled site across requests
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=32, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    
     return session
 
+def setup_async_session(max_concurrency=20, per_host_limit=1):
+    """
+    Setup an aiohttp session with the crawler's headers and connection pooling.
+    Must be called while an event loop is running, and closed (async with) when done.
+    
+    Args:
+        max_concurrency (int): Most connections open at once
+        per_host_limit (int): Most connections open to any one host
+    
+    Returns:
+        aiohttp.ClientSession: Configured session object
+    """
+    # Keep connections alive and cache DNS so sockets are reused across the whole crawl
+    connector = aiohttp.TCPConnector(
+        limit=max_concurrency,
+        limit_per_host=per_host_limit,
+        keepalive_timeout=75,
+        ttl_dns_cache=300
+    )
+    return aiohttp.ClientSession(connector=connector, headers=DEFAULT_HEADERS)
+
 def clean_text(text):
     """
     Clean and normalize text content
@@ -95,10 +222,10 @@ def clean_text(text):
         return ''
     
     # Remove extra whitespace and normalize
-    text = re.sub(r'\s+', ' ', text.strip())
+    text = _WHITESPACE_RE.sub(' ', text.strip())
     
     # Remove control characters
-    text = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x84\x86-\x9f]', '', text)
+    text = _CONTROL_CHARS_RE.sub('', text)
     
     return text
 
@@ -162,6 +289,58 @@ def validate_meta_description_length(description):
     else:
         return {'status': 'good', 'message': f'Meta description length is optimal ({length} chars)'}
 
+def _validate_lengths(texts, label, min_length, max_length):
+    """Statuses and messages of the validate_*_length functions, computed for a whole Series at once"""
+    # Imported here so the crawler, which only needs the URL helpers, doesn't load pandas
+    import numpy as np
+    import pandas as pd
+    
+    lengths = texts.str.len()
+    missing = (lengths.isna() | (lengths == 0)).to_numpy()
+    lengths = lengths.fillna(0).astype(int)
+    too_short = (lengths < min_length).to_numpy()
+    too_long = (lengths > max_length).to_numpy()
+    
+    # Only the length varies within each message, so each is one string concatenation per column
+    chars = ' (' + lengths.astype(str) + ' chars)'
+    aim = f'. Aim for {min_length}-{max_length} characters.'
+    conditions = [missing, too_short, too_long]
+    status = np.select(conditions, ['error', 'warning', 'warning'], default='good')
+    message = np.select(
+        conditions,
+        [f'{label} is missing', (f'{label} too short' + chars + aim).to_numpy(dtype=object),
+         (f'{label} too long' + chars + aim).to_numpy(dtype=object)],
+        default=(f'{label} length is optimal' + chars).to_numpy(dtype=object)
+    )
+    return pd.Series(status, index=texts.index), pd.Series(message, index=texts.index)
+
+def validate_title_lengths(titles):
+    """
+    Validate title lengths for a Series of titles, as validate_title_length does for one
+    
+    Args:
+        titles (pd.Series): Titles to validate
+    
+    Returns:
+        tuple: (status, message) Series aligned with titles
+    """
+    return _validate_lengths(titles, 'Title', 30, 60)
+
+def validate_meta_description_lengths(descriptions):
+    """
+    Validate meta description lengths for a Series of descriptions,
+    as validate_meta_description_length does for one
+    
+    Args:
+        descriptions (pd.Series): Meta descriptions to validate
+    
+    Returns:
+        tuple: (status, message) Series aligned with descriptions
+    """
+    return _validate_lengths(descriptions, 'Meta description', 120, 160)
+
+FILE_SIZE_UNITS = ("B", "KB", "MB", "GB")
+
 def format_file_size(size_bytes):
     """
     Format file size in human readable format
@@ -175,11 +354,8 @@ def format_file_size(size_bytes):
     if size_bytes == 0:
         return "0 B"
     
-    size_names = ["B", "KB", "MB", "GB"]
-    i = 0
-    
-    while size_bytes >= 1024 and i < len(size_names) - 1:
-        size_bytes /= 1024.0
-        i += 1
+    # Each unit is 2**10 times the last, so the unit follows from the bit length
+    # of the whole number of bytes instead of dividing until it fits
+    i = min(len(FILE_SIZE_UNITS) - 1, (int(size_bytes).bit_length() - 1) // 10) if size_bytes >= 1024 else 0
     
-    return f"{size_bytes:.1f} {size_names[i]}"
\ No newline at end of file
+    return f"{size_bytes / (1 << (10 * i)):.1f} {FILE_SIZE_UNITS[i]}"
\ No newline at end of file